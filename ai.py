@@ -3,22 +3,84 @@ ai — Copilot SDK integration for AI-assisted issue creation and chat.
 """
 
 import asyncio
-import json
-
-from .config import ORG, DEFAULT_REPO, WORKSPACE, BOARDS, AI_MODEL
+import atexit
+import builtins
+import functools
+import io
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+
+from . import jsonio
+from .config import ORG, WORKSPACE, BOARDS, AI_MODEL
 from .ui import (
     BOLD, CYAN, DIM, GREEN, YELLOW, RED, MAGENTA, RESET,
     BACK, QUIT,
     clear, banner, nav_hint, prompt, pick_one, multiline, yn, run_steps,
 )
-from .gh import build_body, fetch_labels
-from .wizard import (
-    execute_create, step_title, step_description, step_criteria,
-    step_context, step_labels, step_board_fields, step_review,
-)
 
 # Get first board key as default fallback
-_DEFAULT_BOARD = next(iter(BOARDS.keys())) if BOARDS else \"main\"
+_DEFAULT_BOARD = next(iter(BOARDS.keys())) if BOARDS else "main"
+
+
+# ── Draft model ──────────────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class Draft:
+    """One AI-drafted issue, as described by the system prompt's JSON schema."""
+    title: str = ""
+    description: str = ""
+    criteria: list = field(default_factory=list)
+    board: str = _DEFAULT_BOARD
+    labels: list = field(default_factory=list)
+    fields: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Draft from parsed JSON, ignoring unknown and null keys."""
+        return cls(**{k: v for k, v in data.items() if k in cls.__slots__ and v is not None})
+
+
+
+def _build_field_index():
+    """Map board key → {field key: (field id, options)} for single-select fields."""
+    return {
+        bkey: {
+            fkey: (fdata["id"], fdata["options"])
+            for fkey, fdata in board["fields"].items()
+            if "options" in fdata
+        }
+        for bkey, board in BOARDS.items()
+    }
+
+
+_BOARD_FIELD_INDEX = _build_field_index()
+
+
+# ── Label cache ──────────────────────────────────────────────────────────
+
+# gh's lookup cache is the only layer with a TTL; the memoised helpers here
+# are keyed by the label names themselves, so they can't go stale.
+
+def _labels_for(repo):
+    """Label names for a repo (served from gh's lookup cache when fresh)."""
+    from .gh import fetch_labels
+    return tuple(l["name"] for l in fetch_labels(repo) or ())
+
+
+@lru_cache(maxsize=32)
+def _valid_label_set(names):
+    """Lower-cased label names, for validating drafted labels."""
+    return frozenset(n.lower() for n in names)
+
+
+def _refresh_labels():
+    """Drop cached labels so the next lookup hits GitHub again."""
+    from .gh import invalidate_reads
+
+    invalidate_reads()
 
 
 # ── System prompts ───────────────────────────────────────────────────────
@@ -37,33 +99,30 @@ def _board_schema_text():
     return "\n".join(lines)
 
 
-def _build_ai_system_prompt():
-    """Build the AI system prompt dynamically, including available repo labels."""
-    # Fetch real labels per repo so the AI only uses ones that exist
-    labels_lines = []
-    for bkey, bdata in BOARDS.items():
-        repo = bdata["repo"]
-        labels = fetch_labels(repo)
-        if labels:
-            label_names = [l["name"] for l in labels]
-            labels_lines.append(f"Available labels on {repo}: {', '.join(label_names)}")
-        else:
-            labels_lines.append(f"Could not fetch labels for {repo}.")
-    labels_lines.append("Only use labels from these lists. Do NOT invent labels.")
-    labels_text = "\n".join(labels_lines)
+def _board_repo_text():
+    """List which repo feeds which board, one line per board."""
+    return "\n".join(f"  - {board['repo']} → {key} board" for key, board in BOARDS.items())
+
 
-    return f"""You are a helpful assistant embedded in the Issue Manager CLI.
+# BOARDS, ORG and WORKSPACE are fixed for the life of the process, so the
+# static parts of the prompt are rendered once; only labels vary per call.
+_BOARD_SCHEMA_TEXT = _board_schema_text()
+_BOARD_REPO_TEXT = _board_repo_text()
+
+_AI_PROMPT_HEAD = f"""You are a helpful assistant embedded in the Issue Manager CLI.
 You have access to the user's local workspace at {WORKSPACE}.
 
 GitHub organisation: {ORG}
 
 Repository-to-board mapping:
-{board_repo_text}
+{_BOARD_REPO_TEXT}
 Always set "board" based on which repo the issue belongs to.
 
-{_board_schema_text()}
+{_BOARD_SCHEMA_TEXT}
 
-{labels_text}
+"""
+
+_AI_PROMPT_TAIL = """
 
 SMART FIELD SELECTION — always try to fill in the right fields based on context:
 
@@ -84,19 +143,19 @@ Field selection guidelines:
 When asked to draft issues, always respond with valid JSON — no markdown fences, no preamble, no commentary.
 
 For a SINGLE issue use this schema:
-{{
+{
   "title": "<concise issue title>",
   "description": "<detailed description>",
   "criteria": ["<AC 1>", "<AC 2>", ...],
   "board": "<board_key from the list above>",
   "labels": ["<label>", ...],
-  "fields": {{"<field_name>": "<option_key>", ...}}
-}}
+  "fields": {"<field_name>": "<option_key>", ...}
+}
 
 For MULTIPLE issues return a JSON array of objects with the same schema:
 [
-  {{ "title": "...", "description": "...", ... }},
-  {{ "title": "...", "description": "...", ... }}
+  { "title": "...", "description": "...", ... },
+  { "title": "...", "description": "...", ... }
 ]
 
 Never ask clarifying questions — make your best judgement and draft the issues.
@@ -106,6 +165,29 @@ unless it clearly makes sense to group closely related ones together.
 Read the relevant project files to inform your drafting.
 """
 
+
+async def _build_ai_system_prompt():
+    """Build the AI system prompt dynamically, including available repo labels."""
+    # Fetch real labels per repo so the AI only uses ones that exist.
+    # Each fetch is a blocking gh subprocess, so run them side by side.
+    repos = list(dict.fromkeys(b["repo"] for b in BOARDS.values()))
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(None, _labels_for, r) for r in repos),
+        return_exceptions=True,
+    )
+    labels_lines = []
+    for repo, label_names in zip(repos, results):
+        if label_names and not isinstance(label_names, BaseException):
+            labels_lines.append(f"Available labels on {repo}: {', '.join(label_names)}")
+        else:
+            labels_lines.append(f"Could not fetch labels for {repo}.")
+    labels_lines.append("Only use labels from these lists. Do NOT invent labels.")
+    labels_text = "\n".join(labels_lines)
+
+    return _AI_PROMPT_HEAD + labels_text + _AI_PROMPT_TAIL
+
+
 CHAT_SYSTEM_PROMPT = f"""You are a helpful assistant embedded in the Issue Manager CLI.
 You have access to the user's local workspace at {WORKSPACE}.
 service-fee-review, dependency-track, prodatlas, dns-firewall-zscaler.
@@ -117,65 +199,198 @@ Keep answers concise and practical.
 
 # ── Copilot helpers ──────────────────────────────────────────────────────
 
+# One Copilot client per process: starting it is the slow part, so it is
+# started on first use and kept for later AI screens. It is bound to the
+# event loop it was started on, hence run_ai() below.
+_client = None
+_client_lock = asyncio.Lock()
+_loop = None
+
+
+def run_ai(coro):
+    """Run an AI coroutine on the process-wide event loop."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        atexit.register(_shutdown)
+    return _loop.run_until_complete(coro)
+
+
+# CopilotClient.stop() gathers its cleanup failures into an ExceptionGroup,
+# a builtin from Python 3.11 (which the SDK requires)
+_STOP_ERRORS = (RuntimeError, OSError, getattr(builtins, "ExceptionGroup", RuntimeError))
+
+
+def _shutdown():
+    """Stop the pooled Copilot client and close the event loop at exit."""
+    global _client
+    if _loop is None or _loop.is_closed():
+        return
+    if _client is not None:
+        try:
+            _loop.run_until_complete(_client.stop())
+        except _STOP_ERRORS as exc:  # pragma: no cover
+            print(f"Copilot client did not stop cleanly: {exc}", file=sys.stderr)
+        _client = None
+    _loop.close()
+
+
+async def _get_client():
+    """Return the shared Copilot client, starting it on first use."""
+    global _client
+    async with _client_lock:
+        if _client is None:
+            try:
+                from copilot import CopilotClient
+            except ModuleNotFoundError:
+                raise RuntimeError(
+                    "The 'copilot' SDK is not installed in this Python environment. "
+                    "Use Python 3.11 or install the copilot package."
+                )
+            client = CopilotClient()
+            await client.start()
+            _client = client
+        return _client
+
+
 async def _start_copilot(system_prompt):
-    """Start a Copilot client + session. Returns (client, session)."""
-    try:
-        from copilot import CopilotClient
-    except ModuleNotFoundError:
-        raise RuntimeError(
-            "The 'copilot' SDK is not installed in this Python environment. "
-            "Use Python 3.11 or install the copilot package."
-        )
-    client = CopilotClient()
-    await client.start()
-    session = await client.create_session({
+    """Open a Copilot session on the shared client. Returns the session."""
+    client = await _get_client()
+    return await client.create_session({
         "model": AI_MODEL,
         "working_directory": WORKSPACE,
         "streaming": True,
         "system_message": {"content": system_prompt},
     })
-    return client, session
 
 
-async def _stream_response(session, user_prompt, *, timeout=120, silent=False):
+_SPINNER_FRAMES = tuple(
+    f"\r  {CYAN}{f}{RESET} {DIM}Drafting... "
+    for f in ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+)
+_SPINNER_INTERVAL = 0.1  # seconds between spinner redraws
+_FLUSH_INTERVAL = 0.03   # seconds between stdout flushes while streaming text
+
+
+class _JsonScanner:
+    """Track bracket depth across streamed deltas.
+
+    Each top-level [...] or {...} value is parsed as soon as its closing
+    bracket arrives, so JSON responses don't need re-parsing once the stream
+    ends. Brackets inside string literals are ignored.
+    """
+
+    __slots__ = ("_depth", "_esc", "_in_str", "_parts")
+
+    def __init__(self):
+        self._parts = []
+        self._depth = 0
+        self._in_str = False
+        self._esc = False
+
+    def feed(self, delta):
+        """Consume a delta; return any top-level values it completed."""
+        done = []
+        start = 0 if self._depth else None
+        for i, ch in enumerate(delta):
+            if self._in_str:
+                if self._esc:
+                    self._esc = False
+                elif ch == "\\":
+                    self._esc = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == "[" or ch == "{":
+                if not self._depth:
+                    start = i
+                self._depth += 1
+            elif (ch == "]" or ch == "}") and self._depth:
+                self._depth -= 1
+                if not self._depth:
+                    self._parts.append(delta[start:i + 1])
+                    text = "".join(self._parts)
+                    self._parts = []
+                    start = None
+                    try:
+                        done.append(jsonio.loads(text))
+                    except jsonio.JSONDecodeError:
+                        pass
+            elif ch == '"' and self._depth:
+                self._in_str = True
+        if self._depth:
+            self._parts.append(delta[start:])
+        return done
+
+
+async def _stream_response(session, user_prompt, *, timeout=120, silent=False,
+                           json_values=None, on_delta=None):
     """Send a prompt and stream the response. Returns full text.
 
     When silent=True, output is collected without printing (useful for JSON
     responses). A simple spinner is shown instead.
+
+    If json_values is a list, each top-level JSON value is parsed while the
+    response streams in and appended to it. on_delta, if given, is called
+    with every text delta as it arrives.
     """
     from copilot.generated.session_events import SessionEventType
 
-    chunks = []
+    buf = io.StringIO()
+    chunk_count = [0]
+    scanner = _JsonScanner() if json_values is not None else None
     done = asyncio.Event()
     tool_in_progress = [False]
-    spinner_frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
     frame_idx = [0]
+    last_draw = [0.0]
+    last_flush = [0.0]
+    write, flush = sys.stdout.write, sys.stdout.flush
+
+    # Bound once: on_event runs for every streamed delta
+    DELTA = SessionEventType.ASSISTANT_MESSAGE_DELTA
+    TOOL_DONE = SessionEventType.TOOL_EXECUTION_COMPLETE
+    INTENT = SessionEventType.ASSISTANT_INTENT
+    IDLE = SessionEventType.SESSION_IDLE
+    ERROR = SessionEventType.SESSION_ERROR
 
     def on_event(event):
-        if event.type == SessionEventType.ASSISTANT_MESSAGE_DELTA:
+        etype = event.type
+        if etype is DELTA:
             delta = getattr(event.data, "delta_content", None) or ""
             if delta:
-                chunks.append(delta)
+                buf.write(delta)
+                chunk_count[0] += 1
+                if scanner is not None:
+                    json_values.extend(scanner.feed(delta))
+                if on_delta is not None:
+                    on_delta(delta)
                 if not silent:
-                    print(delta, end="", flush=True)
+                    write(delta)
+                    now = time.monotonic()
+                    if now - last_flush[0] >= _FLUSH_INTERVAL:
+                        flush()
+                        last_flush[0] = now
                 else:
-                    # Update spinner
-                    frame = spinner_frames[frame_idx[0] % len(spinner_frames)]
-                    print(f"\r  {CYAN}{frame}{RESET} {DIM}Drafting... ({len(chunks)} chunks){RESET}  ", end="", flush=True)
-                    frame_idx[0] += 1
-        elif event.type == SessionEventType.TOOL_EXECUTION_COMPLETE:
+                    # Update spinner, at most every _SPINNER_INTERVAL
+                    now = time.monotonic()
+                    if now - last_draw[0] >= _SPINNER_INTERVAL:
+                        frame = _SPINNER_FRAMES[frame_idx[0] % len(_SPINNER_FRAMES)]
+                        write(f"{frame}({chunk_count[0]} chunks){RESET}  ")
+                        flush()
+                        last_draw[0] = now
+                        frame_idx[0] += 1
+        elif etype is TOOL_DONE:
             if tool_in_progress[0]:
                 if not silent:
                     print(f"{RESET}", end="")
                 tool_in_progress[0] = False
-        elif event.type == SessionEventType.ASSISTANT_INTENT:
+        elif etype is INTENT:
             intent = getattr(event.data, "content", None) or ""
             if intent:
                 print(f"\n  {DIM}🔍 {intent}{RESET}", flush=True)
                 tool_in_progress[0] = True
-        elif event.type == SessionEventType.SESSION_IDLE:
+        elif etype is IDLE:
             done.set()
-        elif event.type == SessionEventType.SESSION_ERROR:
+        elif etype is ERROR:
             error = getattr(event.data, "message", str(event.data))
             print(f"\n  {RED}❌ {error}{RESET}")
             done.set()
@@ -188,11 +403,13 @@ async def _stream_response(session, user_prompt, *, timeout=120, silent=False):
     except asyncio.TimeoutError:
         print(f"\n  {YELLOW}⚠ Timed out after {timeout}s{RESET}")
 
+    flush()  # deltas since the last timed flush
+
     if silent:
         print(f"\r  {GREEN}✓{RESET} {DIM}Response received{RESET}                    ")  # clear spinner line
     else:
         print()  # newline after streaming
-    return "".join(chunks)
+    return buf.getvalue()
 
 
 # ── AI issue wizard ──────────────────────────────────────────────────────
@@ -213,15 +430,19 @@ async def wizard_ai_issue():
         return
 
     print(f"\n  {DIM}⏳ Fetching labels & starting Copilot...{RESET}")
-    ai_prompt = _build_ai_system_prompt()
-    client, session = await _start_copilot(ai_prompt)
+    ai_prompt = await _build_ai_system_prompt()
+    session = await _start_copilot(ai_prompt)
 
     try:
         print(f"  {DIM}🤖 Copilot is reading your docs and drafting...{RESET}")
-        raw = await _stream_response(session, user_input, silent=True)
+        streamed = []
+        raw = await _stream_response(session, user_input, silent=True, json_values=streamed)
 
-        # Parse the JSON (always returns a list or None)
-        drafts = _parse_ai_draft(raw)
+        # Prefer what was parsed mid-stream; fall back to parsing the full
+        # text (always returns a list or None)
+        drafts = _as_draft_list(streamed[0]) if streamed else None
+        if not drafts:
+            drafts = _parse_ai_draft(raw)
         if not drafts:
             print(f"\n  {RED}Could not parse Copilot's response as valid issue draft(s).{RESET}")
             print(f"  {DIM}You can try again with a more specific prompt.{RESET}")
@@ -235,7 +456,6 @@ async def wizard_ai_issue():
 
     finally:
         await session.destroy()
-        await client.stop()
 
     prompt("Press enter to return to menu")
 
@@ -272,6 +492,7 @@ async def _review_batch_drafts(session, drafts):
             "create_all": f"Create all {len(drafts)} issues",
             "review": "Review each issue in detail",
             "refine": "Ask Copilot to refine all drafts",
+            "labels": "Re-fetch labels from GitHub",
             "cancel": "Discard all",
         }, allow_skip=False)
 
@@ -294,6 +515,10 @@ async def _review_batch_drafts(session, drafts):
                 return
             _print_batch_summary(drafts)
             continue
+        elif action == "labels":
+            _refresh_labels()
+            _print_batch_summary(drafts)
+            continue
 
 
 def _print_draft(draft, index=None):
@@ -302,62 +527,50 @@ def _print_draft(draft, index=None):
     print(f"\n  {DIM}{'─' * 50}{RESET}")
     if prefix:
         print(prefix, end="")
-    print(f"    {BOLD}Title:{RESET}   {YELLOW}{draft.get('title', '(untitled)')}{RESET}")
-    board_key = draft.get('board', _DEFAULT_BOARD)
-    board_cfg = BOARDS.get(board_key, BOARDS[_DEFAULT_BOARD])
+    print(f"    {BOLD}Title:{RESET}   {YELLOW}{draft.title or '(untitled)'}{RESET}")
+    board_cfg = BOARDS.get(draft.board, BOARDS[_DEFAULT_BOARD])
     print(f"    {BOLD}Repo:{RESET}    {board_cfg['repo']}")
     print(f"    {BOLD}Board:{RESET}   {board_cfg['name']}")
-    if draft.get("labels"):
-        print(f"    {BOLD}Labels:{RESET}  {', '.join(draft['labels'])}")
-    if draft.get("fields"):
-        for k, v in draft["fields"].items():
+    if draft.labels:
+        print(f"    {BOLD}Labels:{RESET}  {', '.join(draft.labels)}")
+    if draft.fields:
+        for k, v in draft.fields.items():
             display = k.replace('_', ' ').title()
             print(f"    {BOLD}{display}:{RESET}  {v}")
     print(f"\n    {BOLD}Description:{RESET}")
-    for ln in draft.get("description", "").split("\n"):
+    for ln in draft.description.split("\n"):
         print(f"      {ln}")
-    if draft.get("criteria"):
+    if draft.criteria:
         print(f"\n    {BOLD}Acceptance Criteria:{RESET}")
-        for c in draft["criteria"]:
+        for c in draft.criteria:
             print(f"      ☐ {c}")
     print(f"  {DIM}{'─' * 50}{RESET}")
 
 
+@lru_cache(maxsize=256)
+def _format_labels(valid_set, labels):
+    """Colour drafted labels by whether they are in valid_set (✗ = unknown)."""
+    if not valid_set:
+        return ", ".join(labels)
+    return ", ".join(
+        f"{GREEN}{l}{RESET}" if l.lower() in valid_set else f"{RED}{l} ✗{RESET}"
+        for l in labels
+    )
+
+
 def _print_batch_summary(drafts):
     """Print a numbered summary table of all drafts, with available labels."""
-    # Collect labels per repo for validation
-    _label_cache = {}
-
     print(f"\n  {BOLD}Copilot drafted {len(drafts)} issue(s):{RESET}\n")
     for i, d in enumerate(drafts, 1):
-        board_key = d.get("board", _DEFAULT_BOARD)
-        board_cfg = BOARDS.get(board_key, BOARDS[_DEFAULT_BOARD])
+        board_cfg = BOARDS.get(d.board, BOARDS[_DEFAULT_BOARD])
         repo = board_cfg["repo"]
-        fields_summary = ", ".join(f"{k}={v}" for k, v in d.get("fields", {}).items())
-        labels = d.get("labels", [])
-
-        # Fetch & cache labels per repo
-        if repo not in _label_cache:
-            repo_labels = fetch_labels(repo)
-            _label_cache[repo] = repo_labels
-        repo_labels = _label_cache[repo]
-
-        # Mark invalid labels
-        if labels and repo_labels:
-            valid_set = {l["name"].lower() for l in repo_labels}
-            label_parts = []
-            for l in labels:
-                if l.lower() in valid_set:
-                    label_parts.append(f"{GREEN}{l}{RESET}")
-                else:
-                    label_parts.append(f"{RED}{l} ✗{RESET}")
-            label_str = f"  labels=[{', '.join(label_parts)}]"
-        elif labels:
-            label_str = f"  labels=[{', '.join(labels)}]"
-        else:
-            label_str = ""
-        print(f"    {CYAN}{i:>2}{RESET}  {YELLOW}{d.get('title', '(untitled)')}{RESET}")
-        print(f"        {DIM}{repo.split('/')[-1]} → {board_cfg['name']}  {fields_summary}{RESET}{label_str}")
+        fields_summary = ", ".join(f"{k}={v}" for k, v in d.fields.items())
+        label_str = ""
+        if d.labels:
+            valid_set = _valid_label_set(_labels_for(repo))
+            label_str = f"  labels=[{_format_labels(valid_set, tuple(d.labels))}]"
+        print(f"    {CYAN}{i:>2}{RESET}  {YELLOW}{d.title or '(untitled)'}{RESET}")
+        print(f"        {DIM}{repo.rpartition('/')[2]} → {board_cfg['name']}  {fields_summary}{RESET}{label_str}")
     print()
 
 
@@ -396,107 +609,161 @@ async def _review_each(session, drafts):
     return kept
 
 
+_BATCH_CONCURRENCY = 4  # parallel gh creates; GitHub throttles bursts beyond this
+
+
 async def _create_batch(drafts):
-    """Create multiple issues sequentially."""
-    print(f"\n  {BOLD}Creating {len(drafts)} issue(s)...{RESET}\n")
-    for i, draft in enumerate(drafts, 1):
-        print(f"  {DIM}── Issue {i}/{len(drafts)} ──{RESET}")
-        print(f"  {YELLOW}{draft.get('title', '(untitled)')}{RESET}")
-        await _create_from_draft(draft)
+    """Create multiple issues, a few at a time.
+
+    Each create runs in a worker thread with its output buffered, and the
+    buffered block is printed as soon as that issue finishes.
+    """
+    from .wizard import execute_create
+
+    total = len(drafts)
+    print(f"\n  {BOLD}Creating {total} issue(s)...{RESET}\n")
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def _one(i, draft):
+        lines = [
+            f"  {DIM}── Issue {i}/{total} ──{RESET}",
+            f"  {YELLOW}{draft.title or '(untitled)'}{RESET}",
+        ]
+        state = _draft_to_state(draft, confirmed=True)
+        async with sem:
+            url = await loop.run_in_executor(
+                None, functools.partial(execute_create, state, log=lines.append),
+            )
+        print("\n".join(lines))
         print()
-    print(f"  {GREEN}🎉 All {len(drafts)} issue(s) created!{RESET}\n")
+        return url
+
+    urls = await asyncio.gather(*(_one(i, d) for i, d in enumerate(drafts, 1)))
+    created = sum(1 for u in urls if u)
+    if created == total:
+        print(f"  {GREEN}🎉 All {total} issue(s) created!{RESET}\n")
+    else:
+        print(f"  {YELLOW}⚠ Created {created} of {total} issue(s).{RESET}\n")
+
+
+_FENCE_RE = re.compile(r"\A\s*```[\w-]*[ \t]*\n(.*?)(?:```)?\s*\Z", re.DOTALL)
+
+_CLOSERS = {"[": "]", "{": "}"}
+
+
+def _json_spans(text):
+    """Yield each top-level bracket-balanced [...] or {...} slice of text.
+
+    Brackets inside JSON string literals (including escaped quotes) are
+    ignored, so prose like "see [1]" within a value doesn't end the span.
+    """
+    start = None
+    stack = []
+    in_str = esc = False
+    for i, ch in enumerate(text):
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == "\\":
+                esc = True
+            elif ch == '"':
+                in_str = False
+        elif ch in _CLOSERS:
+            if start is None:
+                start = i
+            stack.append(_CLOSERS[ch])
+        elif not stack:
+            continue
+        elif ch == '"':
+            in_str = True
+        elif ch == stack[-1]:
+            stack.pop()
+            if not stack:
+                yield text[start:i + 1]
+                start = None
 
 
 def _parse_ai_draft(raw):
     """Extract JSON from Copilot's response. Always returns a list of drafts, or None."""
-    text = raw.strip()
     # Strip markdown code fences if present
-    if text.startswith("```"):
-        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-    if text.endswith("```"):
-        text = text[:-3]
-    text = text.strip()
+    m = _FENCE_RE.match(raw)
+    text = (m.group(1) if m else raw).strip()
 
     parsed = None
     try:
-        parsed = json.loads(text)
-    except json.JSONDecodeError:
-        # Try to find a JSON array first, then object
-        for open_ch, close_ch in [("[", "]"), ("{", "}")]:
-            start = text.find(open_ch)
-            end = text.rfind(close_ch) + 1
-            if start >= 0 and end > start:
-                try:
-                    parsed = json.loads(text[start:end])
-                    break
-                except json.JSONDecodeError:
-                    continue
-
-    if parsed is None:
-        return None
-    if isinstance(parsed, list):
-        return parsed if parsed else None
+        parsed = jsonio.loads(text)
+    except jsonio.JSONDecodeError:
+        # Fall back to the first balanced JSON value embedded in the text
+        for span in _json_spans(text):
+            try:
+                parsed = jsonio.loads(span)
+                break
+            except jsonio.JSONDecodeError:
+                continue
+
+    return _as_draft_list(parsed)
+
+
+def _as_draft_list(parsed):
+    """Normalise a parsed JSON value to a non-empty list of Drafts, or None."""
     if isinstance(parsed, dict):
-        return [parsed]
-    return None
+        parsed = [parsed]
+    if not isinstance(parsed, list):
+        return None
+    drafts = [Draft.from_dict(d) for d in parsed if isinstance(d, dict)]
+    return drafts or None
 
 
-async def _create_from_draft(draft):
-    """Convert an AI draft dict to state and create the issue."""
-    board_key = draft.get("board", _DEFAULT_BOARD)
+def _draft_to_state(draft, *, confirmed):
+    """Convert an AI Draft to wizard state."""
+    board_key = draft.board
     if board_key not in BOARDS:
         board_key = _DEFAULT_BOARD
-    board = BOARDS[board_key]
 
-    state = {
+    return {
         "board_key": board_key,
-        "repo": board["repo"],
-        "title": draft["title"],
-        "description": draft.get("description", ""),
-        "criteria": draft.get("criteria", []),
+        "repo": BOARDS[board_key]["repo"],
+        "title": draft.title,
+        "description": draft.description,
+        "criteria": draft.criteria,
         "extra_context": None,
-        "labels": draft.get("labels", []),
-        "fields": {},
-        "confirmed": True,
+        "labels": draft.labels,
+        "fields": _map_fields(board_key, draft.fields),
+        "confirmed": confirmed,
     }
 
-    # Map field values from the draft
-    for fkey, fval in draft.get("fields", {}).items():
-        if fkey in board["fields"] and "options" in board["fields"][fkey]:
-            opts = board["fields"][fkey]["options"]
-            v = fval.lower()
-            if v in opts:
-                state["fields"][fkey] = (board["fields"][fkey]["id"], opts[v], "single_select")
 
-    execute_create(state)
+def _map_fields(board_key, draft_fields):
+    """Resolve drafted {field: option name} pairs to wizard field tuples."""
+    table = _BOARD_FIELD_INDEX.get(board_key, {})
+    out = {}
+    for fkey, fval in draft_fields.items():
+        entry = table.get(fkey)
+        if entry is None:
+            continue
+        field_id, opts = entry
+        option_id = opts.get(str(fval).lower())
+        if option_id is not None:
+            out[fkey] = (field_id, option_id, "single_select")
+    return out
+
+
+async def _create_from_draft(draft):
+    """Create an issue from an AI Draft."""
+    from .wizard import execute_create
+
+    execute_create(_draft_to_state(draft, confirmed=True))
 
 
 def _load_draft_into_wizard(draft):
     """Load an AI draft into the manual wizard for editing."""
-    board_key = draft.get("board", _DEFAULT_BOARD)
-    if board_key not in BOARDS:
-        board_key = _DEFAULT_BOARD
-    board = BOARDS[board_key]
+    from .wizard import (
+        execute_create, step_title, step_description, step_criteria,
+        step_context, step_labels, step_board_fields, step_review,
+    )
 
-    state = {
-        "board_key": board_key,
-        "repo": board["repo"],
-        "title": draft.get("title", ""),
-        "description": draft.get("description", ""),
-        "criteria": draft.get("criteria", []),
-        "extra_context": None,
-        "labels": draft.get("labels", []),
-        "fields": {},
-        "confirmed": False,
-    }
-
-    # Pre-fill fields
-    for fkey, fval in draft.get("fields", {}).items():
-        if fkey in board["fields"] and "options" in board["fields"][fkey]:
-            opts = board["fields"][fkey]["options"]
-            v = fval.lower()
-            if v in opts:
-                state["fields"][fkey] = (board["fields"][fkey]["id"], opts[v], "single_select")
+    state = _draft_to_state(draft, confirmed=False)
 
     # Jump straight to title step (board + repo pre-filled)
     steps = [
@@ -514,8 +781,19 @@ def _load_draft_into_wizard(draft):
         execute_create(state)
 
 
+_REFINE_PROMPT = (
+    "The user wants to refine the issue(s). Here are the current draft(s):\n"
+    "{{current}}\n\n"
+    "User feedback: {{feedback}}\n\n"
+    "Output the updated issue(s) as valid JSON in the same schema ({shape})."
+)
+_REFINE_PROMPT_SINGLE = _REFINE_PROMPT.format(shape="object")
+_REFINE_PROMPT_BATCH = _REFINE_PROMPT.format(shape="array")
+
+
 async def _refine_loop(session, drafts):
     """Let the user ask Copilot to refine the drafts in a chat loop. Returns updated drafts list."""
+    dumped_for = current_json = None  # JSON of the drafts last sent
     while True:
         print(f"\n  {MAGENTA}Ask Copilot to refine (or type 'done' to finish, 'cancel' to discard):{RESET}")
         feedback = prompt("Feedback")
@@ -526,19 +804,21 @@ async def _refine_loop(session, drafts):
         if not feedback:
             continue
 
-        current = drafts if len(drafts) > 1 else drafts[0]
-        refinement_prompt = (
-            f"The user wants to refine the issue(s). Here are the current draft(s):\n"
-            f"{json.dumps(current, indent=2)}\n\n"
-            f"User feedback: {feedback}\n\n"
-            f"Output the updated issue(s) as valid JSON in the same schema "
-            f"({'array' if len(drafts) > 1 else 'object'})."
-        )
+        if dumped_for is not drafts:
+            current = [asdict(d) for d in drafts] if len(drafts) > 1 else asdict(drafts[0])
+            current_json = jsonio.dumps(current, indent=True)
+            dumped_for = drafts
+        template = _REFINE_PROMPT_BATCH if len(drafts) > 1 else _REFINE_PROMPT_SINGLE
+        refinement_prompt = template.format(current=current_json, feedback=feedback)
 
         print(f"\n  {DIM}🤖 Refining...{RESET}")
         raw = await _stream_response(session, refinement_prompt, silent=True)
         new_drafts = _parse_ai_draft(raw)
-        if new_drafts:
+        if new_drafts == drafts:
+            # Draft equality is field-wise, so an unchanged refinement
+            # skips the summary redraw and its label checks.
+            print(f"\n  {DIM}No changes.{RESET}")
+        elif new_drafts:
             drafts = new_drafts
             print(f"\n  {GREEN}✅ Draft(s) updated.{RESET}")
             _print_batch_summary(drafts)
@@ -559,7 +839,7 @@ async def copilot_chat():
     print(f"  Type {DIM}'exit'{RESET} or {DIM}'q'{RESET} to return to the menu.\n")
 
     print(f"  {DIM}⏳ Starting Copilot...{RESET}")
-    client, session = await _start_copilot(CHAT_SYSTEM_PROMPT)
+    session = await _start_copilot(CHAT_SYSTEM_PROMPT)
 
     try:
         while True:
@@ -575,4 +855,3 @@ async def copilot_chat():
 
     finally:
         await session.destroy()
-        await client.stop()
@@ -6,28 +6,43 @@ structured analysis, and presents actionable findings.
 """
 
 import asyncio
-import json
-
+import hashlib
+import io
+import os
+import re
+import sys
+import time
+from collections import Counter
+from functools import cache, partial
+from typing import Final
+
+from . import jsonio
+from .cache import open_cache
 from .config import ORG, BOARDS, WORKSPACE, AI_MODEL
 from .ui import (
     BOLD, CYAN, DIM, GREEN, YELLOW, RED, MAGENTA, RESET,
     BACK, QUIT,
     clear, banner, nav_hint, prompt, pick_one, yn,
 )
-from .gh import fetch_issues, close_issue
+from .gh import fetch_issues, close_issue, label_names
 
 
 # ═════════════════════════════════════════════════════════════════════════════
 # ANALYSIS SYSTEM PROMPT
 # ═════════════════════════════════════════════════════════════════════════════
 
-_ANALYSIS_SYSTEM_PROMPT = f"""You are a senior engineering manager and product owner
+# Rendered once at import and sent unchanged with every session, so the
+# prompt prefix stays byte-identical between runs for provider-side caching.
+_ANALYSIS_SYSTEM_PROMPT: Final[str] = f"""You are a senior engineering manager and product owner
 reviewing a development team's backlog.
 
 Organisation: {ORG}
 Workspace: {WORKSPACE}
 
 You will receive a JSON array of all open issues across two repositories/boards.
+Each issue uses abbreviated keys: n=number, r=repo, t=title, l=labels,
+a=assignees, c=created, u=updated. l and a are omitted when empty. Use the
+full key names in your report.
 Analyse them thoroughly and produce a structured JSON report.
 
 Respond ONLY with valid JSON — no markdown, no commentary.
@@ -103,43 +118,122 @@ Rules:
 # FETCH ALL ISSUES
 # ═════════════════════════════════════════════════════════════════════════════
 
-def _fetch_all_issues():
-    """Fetch all open issues from every configured board repo."""
+# Issue lists are reused across analyse runs in the same session for
+# _ISSUES_TTL seconds, then refetched. Nothing older is served: they are the
+# analysis input, and closing issues from a report clears the cache.
+_ISSUES_TTL = 120
+_ISSUES_CACHE = open_cache("analyse", ttl=_ISSUES_TTL)  # (repo, state, limit) -> issues
+
+
+def _cached_fetch_issues(repo, *, state="open", limit=200):
+    """fetch_issues with the session cache described above."""
+    key = (repo, state, limit)
+    issues = _ISSUES_CACHE.get(key)
+    if issues is None:
+        issues = fetch_issues(repo, state=state, limit=limit)
+        if issues is not None:
+            _ISSUES_CACHE.set(key, issues)
+    return list(issues or ())
+
+
+async def _fetch_all_issues():
+    """Fetch all open issues from every configured board repo, concurrently."""
+    boards = list(BOARDS.items())
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_cached_fetch_issues, board["repo"], state="open", limit=200)
+          for _, board in boards),
+        return_exceptions=True,
+    )
     all_issues = []
-    for bkey, board in BOARDS.items():
+    for (bkey, board), issues in zip(boards, results):
+        if isinstance(issues, BaseException):
+            continue
         repo = board["repo"]
-        issues = fetch_issues(repo, state="open", limit=200)
-        for issue in issues:
-            issue["_repo"] = repo
-            issue["_board"] = bkey
-        all_issues.extend(issues)
+        # The fetched dicts are shared with the caches, so tag copies
+        all_issues.extend({**issue, "_repo": repo, "_board": bkey} for issue in issues)
     return all_issues
 
 
+@cache
+def _short_repo(repo):
+    """'org/name' → 'name', memoised since reports repeat a handful of repos."""
+    return repo.rpartition("/")[2]
+
+
 def _issues_to_prompt(issues):
-    """Convert issues list to a compact JSON string for the AI prompt."""
+    """Convert issues list to a compact JSON string for the AI prompt.
+
+    Keys are abbreviated (see _ANALYSIS_SYSTEM_PROMPT) since they repeat for
+    every issue. State and board are left out: every issue is open, and the
+    board follows from the repo. Empty label and assignee lists are omitted.
+    """
     compact = []
     for i in issues:
-        labels = [l["name"] for l in i.get("labels", [])] if i.get("labels") else []
-        assignees = [a["login"] for a in i.get("assignees", [])] if i.get("assignees") else []
-        compact.append({
-            "number": i["number"],
-            "repo": i["_repo"],
-            "board": i["_board"],
-            "title": i["title"],
-            "state": i["state"],
-            "labels": labels,
-            "assignees": assignees,
-            "created": i.get("createdAt", "")[:10],
-            "updated": i.get("updatedAt", "")[:10],
-        })
-    return json.dumps(compact, indent=2)
+        entry = {"n": i["number"], "r": i["_repo"], "t": i["title"]}
+        labels = label_names(i)
+        if labels:
+            entry["l"] = labels
+        assignees = [a["login"] for a in i.get("assignees") or ()]
+        if assignees:
+            entry["a"] = assignees
+        entry["c"] = i.get("createdAt", "")[:10]
+        entry["u"] = i.get("updatedAt", "")[:10]
+        compact.append(entry)
+    # Unindented: indentation only adds prompt tokens
+    return jsonio.dumps(compact)
 
 
 # ═════════════════════════════════════════════════════════════════════════════
 # RUN ANALYSIS
 # ═════════════════════════════════════════════════════════════════════════════
 
+# The last parsed report is kept on disk and offered again while the backlog
+# it was built from is unchanged and the report is under _REPORT_MAX_AGE old.
+_REPORT_CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "gh-issue-manager", "last_report.json",
+)
+_REPORT_MAX_AGE = 3600
+
+
+def _backlog_hash(issues):
+    """Fingerprint the fetched backlog: which issues exist and when they last changed."""
+    keys = sorted((i["_repo"], i["number"], i.get("updatedAt", "")) for i in issues)
+    return hashlib.blake2b(jsonio.dumps(keys).encode(), digest_size=16).hexdigest()
+
+
+def _load_cached_report(backlog_hash):
+    """Return (report, age_seconds) for a fresh cached report, else None."""
+    try:
+        with open(_REPORT_CACHE, encoding="utf-8") as f:
+            cached = jsonio.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("hash") != backlog_hash:
+        return None
+    age = time.time() - cached.get("ts", 0)
+    report = _conform_report(cached.get("report"))
+    if report is None or not 0 <= age < _REPORT_MAX_AGE:
+        return None
+    return report, age
+
+
+def _save_report(report, backlog_hash):
+    """Write the report cache atomically; failures are ignored."""
+    data = {"hash": backlog_hash, "ts": time.time(), "report": report}
+    tmp = f"{_REPORT_CACHE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(_REPORT_CACHE), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(jsonio.dumps(data))
+        os.replace(tmp, _REPORT_CACHE)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
 async def analyse_backlog():
     """Fetch all issues, send to Copilot for analysis, display results."""
     clear()
@@ -148,149 +242,330 @@ async def analyse_backlog():
     print(f"  Fetches all open issues from both boards and asks Copilot to")
     print(f"  find duplicates, stale items, priority gaps, risks, and quick wins.\n")
 
-    # ── Fetch ────────────────────────────────────────────────────────────
-    print(f"  {DIM}⏳ Fetching issues from all boards...{RESET}")
-    issues = _fetch_all_issues()
-    if not issues:
-        print(f"\n  {YELLOW}No open issues found across any board.{RESET}")
-        prompt("Press enter to return")
-        return
+    from .ai import _start_copilot
 
-    # Print summary of what was fetched
-    by_repo = {}
-    for i in issues:
-        r = i["_repo"].split("/")[-1]
-        by_repo[r] = by_repo.get(r, 0) + 1
-    parts = [f"{v} from {k}" for k, v in by_repo.items()]
-    print(f"  {GREEN}✓ {len(issues)} open issues{RESET}  ({', '.join(parts)})\n")
-
-    proceed = yn("Run AI analysis on these issues?")
-    if proceed is not True:
-        return
-
-    # ── Start Copilot ────────────────────────────────────────────────────
-    from .ai import _start_copilot, _stream_response
-
-    print(f"\n  {DIM}⏳ Starting Copilot...{RESET}")
-    client, session = await _start_copilot(_ANALYSIS_SYSTEM_PROMPT)
+    # Copilot starts up in the background while the issues download, and is
+    # only awaited once the user confirms the analysis.
+    copilot_task = asyncio.create_task(_start_copilot(_ANALYSIS_SYSTEM_PROMPT))
 
     try:
-        issues_json = _issues_to_prompt(issues)
-        user_prompt = (
-            f"Here are {len(issues)} open issues across our boards. "
-            f"Analyse them and produce the JSON report.\n\n{issues_json}"
-        )
-
-        print(f"  {DIM}🤖 Analysing {len(issues)} issues...{RESET}")
-        raw = await _stream_response(session, user_prompt, timeout=180, silent=True)
-
-        report = _parse_report(raw)
-        if not report:
-            print(f"\n  {RED}Could not parse Copilot's analysis.{RESET}")
-            print(f"  {DIM}Raw response:{RESET}\n")
-            for line in raw.split("\n")[:20]:
-                print(f"    {line}")
-            prompt("\nPress enter to return")
+        # ── Fetch ────────────────────────────────────────────────────────
+        print(f"  {DIM}⏳ Fetching issues from all boards...{RESET}")
+        issues = await _fetch_all_issues()
+        if not issues:
+            print(f"\n  {YELLOW}No open issues found across any board.{RESET}")
+            prompt("Press enter to return")
             return
 
+        # Print summary of what was fetched
+        by_repo = Counter(_short_repo(i["_repo"]) for i in issues)
+        parts = [f"{v} from {k}" for k, v in by_repo.items()]
+        print(f"  {GREEN}✓ {len(issues)} open issues{RESET}  ({', '.join(parts)})\n")
+
+        backlog_hash = _backlog_hash(issues)
+        report = None
+        cached = _load_cached_report(backlog_hash)
+        if cached:
+            reuse = yn(f"Use the cached analysis from {int(cached[1] // 60)} min ago? (backlog unchanged)")
+            if reuse in (BACK, QUIT):
+                return
+            if reuse is True:
+                report = cached[0]
+
+        if report is None:
+            report = await _run_analysis(copilot_task, issues)
+            if report is None:
+                return
+            _save_report(report, backlog_hash)
+
         # ── Display results ──────────────────────────────────────────────
         _display_report(report, issues)
 
         # ── Follow-up actions ────────────────────────────────────────────
-        await _action_menu(session, report, issues)
+        await _action_menu(copilot_task, report, issues)
 
     finally:
-        await session.destroy()
-        await client.stop()
+        await _discard_copilot(copilot_task)
 
     prompt("Press enter to return to menu")
 
 
+async def _run_analysis(copilot_task, issues):
+    """Confirm, then have Copilot analyse the issues. Returns the report or None."""
+    from .ai import _stream_response
+
+    proceed = yn("Run AI analysis on these issues?")
+    if proceed is not True:
+        return None
+
+    # ── Start Copilot ────────────────────────────────────────────────────
+    if not copilot_task.done():
+        print(f"\n  {DIM}⏳ Starting Copilot...{RESET}")
+    session = await copilot_task
+
+    issues_json = _issues_to_prompt(issues)
+    user_prompt = (
+        f"Here are {len(issues)} open issues across our boards. "
+        f"Analyse them and produce the JSON report.\n\n{issues_json}"
+    )
+
+    print(f"  {DIM}🤖 Analysing {len(issues)} issues...{RESET}")
+    preview = _ReportPreview()
+    raw = await _stream_response(
+        session, user_prompt, timeout=180, silent=True, on_delta=preview.feed,
+    )
+
+    report = _parse_report(raw)
+    if not report:
+        print(f"\n  {RED}Could not parse Copilot's analysis.{RESET}")
+        print(f"  {DIM}Raw response:{RESET}\n")
+        for line in raw.split("\n")[:20]:
+            print(f"    {line}")
+        prompt("\nPress enter to return")
+        return None
+    return report
+
+
+async def _discard_copilot(task):
+    """Cancel a Copilot start if still pending, destroying the session if it finished."""
+    if not task.done():
+        task.cancel()
+    try:
+        session = await task
+    # RuntimeError/OSError: the SDK is missing or its CLI server failed to
+    # start; ValueError: the client rejected its configuration
+    except (asyncio.CancelledError, RuntimeError, OSError, ValueError):
+        return
+    await session.destroy()
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 # PARSE & DISPLAY
 # ═════════════════════════════════════════════════════════════════════════════
 
+# Top-level shape of the report requested in _ANALYSIS_SYSTEM_PROMPT. The
+# Copilot SDK has no structured-output option, so replies are conformed to
+# this client-side rather than trusted or discarded.
+_REPORT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary":             {"type": "object"},
+        "duplicates":          {"type": "array", "items": {"type": "object"}},
+        "stale":               {"type": "array", "items": {"type": "object"}},
+        "priority_assessment": {"type": "array", "items": {"type": "object"}},
+        "risks_and_blockers":  {"type": "array", "items": {"type": "object"}},
+        "quick_wins":          {"type": "array", "items": {"type": "object"}},
+        "recommendations":     {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+_JSON_TYPES = {"object": dict, "array": list, "string": str}
+
+
+def _conform_report(report):
+    """Coerce a parsed report to _REPORT_SCHEMA, or None if it isn't a report.
+
+    Missing or mistyped sections become empty, and array items of the wrong
+    type are dropped, so the display code can rely on the shape.
+    """
+    props = _REPORT_SCHEMA["properties"]
+    if not isinstance(report, dict) or not any(k in report for k in props):
+        return None
+    for key, spec in props.items():
+        kind = _JSON_TYPES[spec["type"]]
+        value = report.get(key)
+        if not isinstance(value, kind):
+            report[key] = kind()
+        elif "items" in spec:
+            item_kind = _JSON_TYPES[spec["items"]["type"]]
+            report[key] = [v for v in value if isinstance(v, item_kind)]
+    return report
+
+
 def _parse_report(raw):
     """Extract JSON report from Copilot response."""
-    text = raw.strip()
-    if text.startswith("```"):
-        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-    if text.endswith("```"):
-        text = text[:-3]
-    text = text.strip()
+    from .ai import _FENCE_RE, _json_spans
+
+    m = _FENCE_RE.match(raw)
+    text = (m.group(1) if m else raw).strip()
 
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        # Try to find JSON object
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start >= 0 and end > start:
-            try:
-                return json.loads(text[start:end])
-            except json.JSONDecodeError:
-                pass
+        return _conform_report(jsonio.loads(text))
+    except jsonio.JSONDecodeError:
+        pass
+    # Fall back to the first embedded JSON value that reads as a report
+    for span in _json_spans(text):
+        try:
+            report = _conform_report(jsonio.loads(span))
+        except jsonio.JSONDecodeError:
+            continue
+        if report is not None:
+            return report
     return None
 
 
+def _repair_json(text):
+    """Close any open string, array or object so a truncated JSON prefix parses.
+
+    Trailing commas and dangling keys are tidied up; a prefix cut mid-literal
+    (e.g. `tru`) is left as-is and will simply fail to parse.
+    """
+    stack = []
+    in_str = esc = False
+    for ch in text:
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == "\\":
+                esc = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == "[":
+            stack.append("]")
+        elif ch == "{":
+            stack.append("}")
+        elif (ch == "]" or ch == "}") and stack:
+            stack.pop()
+    if in_str:
+        text = (text[:-1] if esc else text) + '"'
+    text = text.rstrip()
+    if text.endswith(","):
+        text = text[:-1]
+    elif text.endswith(":"):
+        text += " null"
+    return text + "".join(reversed(stack))
+
+
+class _ReportPreview:
+    """Print report entries as they complete while the analysis streams in.
+
+    The buffered response is repaired and parsed at most every
+    _PREVIEW_INTERVAL seconds; the final, complete parse in _parse_report
+    stays authoritative.
+    """
+
+    _PREVIEW_INTERVAL = 0.25
+    _SECTIONS = (
+        ("duplicates", "🔁", lambda e: e.get("group", "unnamed")),
+        ("stale", "🕸️ ", lambda e: f"#{e.get('number', '?')} {e.get('title', '')}"),
+        ("priority_assessment", "📊",
+         lambda e: f"{str(e.get('category', '?')).upper()} ({len(e.get('issues') or [])} issues)"),
+    )
+
+    def __init__(self):
+        self._parts = []
+        self._shown = {}
+        self._last = 0.0
+
+    def feed(self, delta):
+        self._parts.append(delta)
+        now = time.monotonic()
+        if now - self._last < self._PREVIEW_INTERVAL:
+            return
+        self._last = now
+
+        text = "".join(self._parts)
+        start = text.find("{")
+        if start < 0:
+            return
+        try:
+            partial = jsonio.loads(_repair_json(text[start:]))
+        except ValueError:
+            return
+        if not isinstance(partial, dict):
+            return
+
+        last_key = next(reversed(partial), None)
+        for key, icon, describe in self._SECTIONS:
+            entries = partial.get(key)
+            if not isinstance(entries, list):
+                continue
+            # The newest entry may have been cut short unless a later key
+            # has already started, which means this array is closed.
+            complete = entries if key != last_key else entries[:-1]
+            shown = self._shown.get(key, 0)
+            for entry in complete[shown:]:
+                if isinstance(entry, dict):
+                    sys.stdout.write(f"\r  {DIM}{icon} {describe(entry)}{RESET}\033[K\n")
+            self._shown[key] = max(shown, len(complete))
+        sys.stdout.flush()
+
+
+# ANSI fragments of the per-issue report lines, rendered once:
+# "<colour>#<number><reset>  <title>  <dim>(<note>)<reset>"
+_CYAN_HASH = f"{CYAN}#"
+_RED_HASH = f"{RED}#"
+_YELLOW_HASH = f"{YELLOW}#"
+_GREEN_HASH = f"{GREEN}#"
+_GAP = f"{RESET}  "
+_NOTE_OPEN = f"  {DIM}("
+_NOTE_CLOSE = f"){RESET}"
+
+
 def _display_report(report, issues):
     """Render the analysis report to the terminal."""
     clear()
     banner()
 
+    # The report is rendered into a buffer and written out in one go
+    buf = io.StringIO()
+    out = partial(print, file=buf)
+
     # ── Summary ──────────────────────────────────────────────────────────
     summary = report.get("summary", {})
-    print(f"  {MAGENTA}{BOLD}🔬 Backlog Analysis Report{RESET}\n")
-    print(f"  {BOLD}Summary{RESET}")
-    print(f"    Total open issues:  {CYAN}{summary.get('total_issues', len(issues))}{RESET}")
+    out(f"  {MAGENTA}{BOLD}🔬 Backlog Analysis Report{RESET}\n")
+    out(f"  {BOLD}Summary{RESET}")
+    out(f"    Total open issues:  {CYAN}{summary.get('total_issues', len(issues))}{RESET}")
     by_repo = summary.get("by_repo", {})
     for repo, count in by_repo.items():
-        repo_short = repo.split("/")[-1] if "/" in repo else repo
-        print(f"    {repo_short:25s} {count}")
+        repo_short = _short_repo(repo)
+        out(f"    {repo_short:25s} {count}")
     avg_age = summary.get("avg_age_days")
     if avg_age:
-        print(f"    Average age:        {avg_age} days")
+        out(f"    Average age:        {avg_age} days")
     oldest = summary.get("oldest_issue")
     if oldest:
-        repo_short = oldest.get("repo", "").split("/")[-1]
-        print(f"    Oldest:             #{oldest.get('number')} {DIM}({repo_short}, {oldest.get('created', '?')}){RESET}")
-        print(f"                        {DIM}{oldest.get('title', '')}{RESET}")
+        repo_short = _short_repo(oldest.get("repo", ""))
+        out(f"    Oldest:             #{oldest.get('number')} {DIM}({repo_short}, {oldest.get('created', '?')}){RESET}")
+        out(f"                        {DIM}{oldest.get('title', '')}{RESET}")
 
     # ── Duplicates ───────────────────────────────────────────────────────
     dupes = report.get("duplicates", [])
-    print(f"\n  {BOLD}{'🔁 Potential Duplicates' if dupes else '🔁 No Duplicates Found'}{RESET}")
+    out(f"\n  {BOLD}{'🔁 Potential Duplicates' if dupes else '🔁 No Duplicates Found'}{RESET}")
     if dupes:
-        print(f"  {DIM}Found {len(dupes)} group(s) of similar issues{RESET}\n")
+        out(f"  {DIM}Found {len(dupes)} group(s) of similar issues{RESET}\n")
     for group in dupes:
         label = group.get("group", "unnamed")
-        print(f"    {YELLOW}{BOLD}{label}{RESET}")
+        out(f"    {YELLOW}{BOLD}{label}{RESET}")
         for iss in group.get("issues", []):
-            repo_short = iss.get("repo", "").split("/")[-1]
-            print(f"      {CYAN}#{iss['number']}{RESET}  {iss.get('title', '')}  {DIM}({repo_short}){RESET}")
+            repo_short = _short_repo(iss.get("repo", ""))
+            out(f"      {_CYAN_HASH}{iss['number']}{_GAP}{iss.get('title', '')}{_NOTE_OPEN}{repo_short}{_NOTE_CLOSE}")
         rec = group.get("recommendation", "")
         if rec:
-            print(f"      {DIM}→ {rec}{RESET}")
-        print()
+            out(f"      {DIM}→ {rec}{RESET}")
+        out()
 
     # ── Stale ────────────────────────────────────────────────────────────
     stale = report.get("stale", [])
-    print(f"  {BOLD}{'🕸️  Stale Issues' if stale else '🕸️  No Stale Issues'}{RESET}")
+    out(f"  {BOLD}{'🕸️  Stale Issues' if stale else '🕸️  No Stale Issues'}{RESET}")
     if stale:
-        print(f"  {DIM}Issues older than 60 days with no recent activity{RESET}\n")
+        out(f"  {DIM}Issues older than 60 days with no recent activity{RESET}\n")
     for s in stale:
-        repo_short = s.get("repo", "").split("/")[-1]
+        repo_short = _short_repo(s.get("repo", ""))
         age = s.get("age_days", "?")
         rec = s.get("recommendation", "")
-        colour = RED if rec == "close" else YELLOW
-        print(f"    {colour}#{s['number']}{RESET}  {s.get('title', '')}  "
-              f"{DIM}({repo_short}, {age}d old){RESET}")
-        print(f"      {DIM}→ {rec}{RESET}")
+        hash_pfx = _RED_HASH if rec == "close" else _YELLOW_HASH
+        out(f"    {hash_pfx}{s['number']}{_GAP}{s.get('title', '')}"
+            f"{_NOTE_OPEN}{repo_short}, {age}d old{_NOTE_CLOSE}")
+        out(f"      {DIM}→ {rec}{RESET}")
     if stale:
-        print()
+        out()
 
     # ── Priority Assessment ──────────────────────────────────────────────
     priorities = report.get("priority_assessment", [])
-    print(f"  {BOLD}📊 Priority Assessment{RESET}\n")
+    out(f"  {BOLD}📊 Priority Assessment{RESET}\n")
     priority_colours = {
         "critical": RED,
         "high": YELLOW,
@@ -303,58 +578,69 @@ def _display_report(report, issues):
         cat_issues = cat.get("issues", [])
         if not cat_issues:
             continue
-        print(f"    {colour}{BOLD}{category.upper()}{RESET}  ({len(cat_issues)} issues)")
+        out(f"    {colour}{BOLD}{category.upper()}{RESET}  ({len(cat_issues)} issues)")
         for iss in cat_issues:
-            repo_short = iss.get("repo", "").split("/")[-1]
-            print(f"      {CYAN}#{iss['number']}{RESET}  {iss.get('title', '')}  {DIM}({repo_short}){RESET}")
+            repo_short = _short_repo(iss.get("repo", ""))
+            out(f"      {_CYAN_HASH}{iss['number']}{_GAP}{iss.get('title', '')}{_NOTE_OPEN}{repo_short}{_NOTE_CLOSE}")
             reason = iss.get("reason", "")
             if reason:
-                print(f"        {DIM}{reason}{RESET}")
-        print()
+                out(f"        {DIM}{reason}{RESET}")
+        out()
 
     # ── Risks & Blockers ─────────────────────────────────────────────────
     risks = report.get("risks_and_blockers", [])
-    print(f"  {BOLD}{'⚠️  Risks & Blockers' if risks else '⚠️  No Risks or Blockers Identified'}{RESET}")
+    out(f"  {BOLD}{'⚠️  Risks & Blockers' if risks else '⚠️  No Risks or Blockers Identified'}{RESET}")
     if risks:
-        print()
+        out()
     for r in risks:
-        repo_short = r.get("repo", "").split("/")[-1]
-        print(f"    {RED}#{r.get('issue_number', '?')}{RESET}  {r.get('title', '')}  {DIM}({repo_short}){RESET}")
-        print(f"      {YELLOW}{r.get('risk', '')}{RESET}")
+        repo_short = _short_repo(r.get("repo", ""))
+        out(f"    {_RED_HASH}{r.get('issue_number', '?')}{_GAP}{r.get('title', '')}{_NOTE_OPEN}{repo_short}{_NOTE_CLOSE}")
+        out(f"      {YELLOW}{r.get('risk', '')}{RESET}")
     if risks:
-        print()
+        out()
 
     # ── Quick Wins ───────────────────────────────────────────────────────
     wins = report.get("quick_wins", [])
-    print(f"  {BOLD}{'⚡ Quick Wins' if wins else '⚡ No Quick Wins Identified'}{RESET}")
+    out(f"  {BOLD}{'⚡ Quick Wins' if wins else '⚡ No Quick Wins Identified'}{RESET}")
     if wins:
-        print()
+        out()
     for w in wins:
-        repo_short = w.get("repo", "").split("/")[-1]
-        print(f"    {GREEN}#{w['number']}{RESET}  {w.get('title', '')}  {DIM}({repo_short}){RESET}")
+        repo_short = _short_repo(w.get("repo", ""))
+        out(f"    {_GREEN_HASH}{w['number']}{_GAP}{w.get('title', '')}{_NOTE_OPEN}{repo_short}{_NOTE_CLOSE}")
         reason = w.get("reason", "")
         if reason:
-            print(f"      {DIM}{reason}{RESET}")
+            out(f"      {DIM}{reason}{RESET}")
     if wins:
-        print()
+        out()
 
     # ── Recommendations ──────────────────────────────────────────────────
     recs = report.get("recommendations", [])
     if recs:
-        print(f"  {BOLD}💡 Recommendations{RESET}\n")
+        out(f"  {BOLD}💡 Recommendations{RESET}\n")
         for i, rec in enumerate(recs, 1):
-            print(f"    {CYAN}{i}.{RESET} {rec}")
-        print()
+            out(f"    {CYAN}{i}.{RESET} {rec}")
+        out()
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 # ═════════════════════════════════════════════════════════════════════════════
 # FOLLOW-UP ACTIONS
 # ═════════════════════════════════════════════════════════════════════════════
 
-async def _action_menu(session, report, issues):
-    """Let the user act on the analysis findings."""
+async def _action_menu(copilot_task, report, issues):
+    """Let the user act on the analysis findings.
+
+    copilot_task resolves to the Copilot session; it is only awaited when the
+    user asks a follow-up question, so a cached report never waits on it.
+    """
     from .ai import _stream_response
 
+    # The report is serialised once and only sent with the first follow-up
+    # question; later questions rely on the session's conversation history.
+    report_ctx = None
+
     while True:
         print(f"\n  {DIM}{'─' * 50}{RESET}")
         action = pick_one("What would you like to do?", {
@@ -378,15 +664,46 @@ async def _action_menu(session, report, issues):
             question = prompt("Question")
             if question in (BACK, QUIT) or not question:
                 continue
-            context = (
-                f"The user has just reviewed a backlog analysis. Here is the report:\n"
-                f"{json.dumps(report, indent=2)}\n\n"
-                f"User question: {question}"
-            )
+            if report_ctx is None:
+                report_ctx = jsonio.dumps(report)
+                context = (
+                    f"The user has just reviewed a backlog analysis. Here is the report:\n"
+                    f"{report_ctx}\n\n"
+                    f"User question: {question}"
+                )
+            else:
+                context = f"User question: {question}"
+            if not copilot_task.done():
+                print(f"\n  {DIM}⏳ Starting Copilot...{RESET}")
+            session = await copilot_task
             print(f"\n  {DIM}🤖 Copilot:{RESET}\n")
             await _stream_response(session, context)
 
 
+_NUM_RE = re.compile(r"#?(\d+)(?:\s*-\s*#?(\d+))?")
+
+
+def _parse_nums(raw, candidates):
+    """Pick the candidates named by issue numbers like "#12, 15-18".
+
+    Returns (numbers, unmatched): the matching candidates, and the typed
+    entries that matched none. Ranges are tested against the candidates
+    rather than expanded, so a typo like 12-120000000 costs nothing.
+    """
+    numbers, unmatched = set(), []
+    for m in _NUM_RE.finditer(raw):
+        lo = int(m.group(1))
+        hi = int(m.group(2) or lo)
+        if hi < lo:
+            print(f"  {YELLOW}⚠ {m.group()} is a reversed range, skipping.{RESET}")
+            continue
+        hits = {n for n in candidates if lo <= n <= hi}
+        if not hits:
+            unmatched.append(m.group())
+        numbers |= hits
+    return numbers, unmatched
+
+
 async def _close_duplicates(report):
     """Offer to close issues identified as duplicates."""
     dupes = report.get("duplicates", [])
@@ -401,43 +718,32 @@ async def _close_duplicates(report):
 
         print(f"\n  {YELLOW}{BOLD}{label}{RESET}")
         for iss in group_issues:
-            repo_short = iss.get("repo", "").split("/")[-1]
+            repo_short = _short_repo(iss.get("repo", ""))
             print(f"    {CYAN}#{iss['number']}{RESET}  {iss.get('title', '')}  {DIM}({repo_short}){RESET}")
         if rec:
             print(f"    {DIM}Recommendation: {rec}{RESET}")
 
-        raw = prompt(f"Issue numbers to close (comma-separated, blank to skip)")
+        raw = prompt("Issue numbers to close (e.g. 12, 15-18; blank to skip)")
         if raw in (BACK, QUIT):
             return
         if not raw:
             continue
 
-        numbers = []
-        for part in raw.split(","):
-            part = part.strip().lstrip("#")
-            try:
-                numbers.append(int(part))
-            except ValueError:
-                pass
-
-        for num in numbers:
-            # Find the repo for this issue number
-            repo = None
-            for iss in group_issues:
-                if iss["number"] == num:
-                    repo = iss.get("repo")
-                    break
-            if not repo:
-                print(f"  {YELLOW}⚠ #{num} not found in this group, skipping.{RESET}")
-                continue
+        group_repos = {iss["number"]: iss.get("repo") for iss in group_issues}
+        numbers, unmatched = _parse_nums(raw, group_repos)
+        targets = [(group_repos[num], num) for num in sorted(numbers) if group_repos[num]]
+        if unmatched:
+            print(f"  {YELLOW}⚠ Not in this group, skipping: {', '.join(unmatched)}{RESET}")
+        if not targets:
+            continue
 
-            confirm = yn(f"  Close #{num} in {repo.split('/')[-1]}?")
-            if confirm is True:
-                result = close_issue(repo, num)
-                if result is not None:
-                    print(f"  {GREEN}✅ #{num} closed.{RESET}")
-                else:
-                    print(f"  {RED}❌ Failed to close #{num}.{RESET}")
+        listed = ", ".join(f"#{num} ({_short_repo(repo)})" for repo, num in targets)
+        print(f"  Will close: {listed}")
+        confirm = yn(f"  Close {len(targets)} issue(s)?")
+        if confirm in (BACK, QUIT):
+            return
+        if confirm is True:
+            await _close_many(targets)
 
 
 async def _close_stale(report):
@@ -458,38 +764,55 @@ async def _close_stale(report):
 
     print(f"\n  {BOLD}Stale issues recommended for closing:{RESET}\n")
     for s in closeable:
-        repo_short = s.get("repo", "").split("/")[-1]
+        repo_short = _short_repo(s.get("repo", ""))
         print(f"    {RED}#{s['number']}{RESET}  {s.get('title', '')}  {DIM}({repo_short}, {s.get('age_days', '?')}d){RESET}")
     print()
 
     confirm_all = yn(f"Close all {len(closeable)} stale issues?")
     if confirm_all is True:
-        for s in closeable:
-            repo = s.get("repo", "")
-            num = s["number"]
-            result = close_issue(repo, num)
-            if result is not None:
-                print(f"  {GREEN}✅ #{num} closed.{RESET}")
-            else:
-                print(f"  {RED}❌ Failed to close #{num}.{RESET}")
+        await _close_many([(s.get("repo", ""), s["number"]) for s in closeable])
     elif confirm_all is False:
         # Let them pick individually
-        raw = prompt("Issue numbers to close (comma-separated, blank to skip)")
+        raw = prompt("Issue numbers to close (e.g. 12, 15-18; blank to skip)")
         if raw in (BACK, QUIT) or not raw:
             return
-        numbers = set()
-        for part in raw.split(","):
-            part = part.strip().lstrip("#")
-            try:
-                numbers.add(int(part))
-            except ValueError:
-                pass
-
-        for s in closeable:
-            if s["number"] in numbers:
-                repo = s.get("repo", "")
-                result = close_issue(repo, s["number"])
-                if result is not None:
-                    print(f"  {GREEN}✅ #{s['number']} closed.{RESET}")
-                else:
-                    print(f"  {RED}❌ Failed to close #{s['number']}.{RESET}")
+        numbers, unmatched = _parse_nums(raw, {s["number"] for s in closeable})
+        if unmatched:
+            print(f"  {YELLOW}⚠ Not in the stale list, skipping: {', '.join(unmatched)}{RESET}")
+        await _close_many([
+            (s.get("repo", ""), s["number"]) for s in closeable if s["number"] in numbers
+        ])
+
+
+_CLOSE_CONCURRENCY = 8  # parallel close_issue calls (REST PATCHes, or gh CLI without a token)
+
+
+async def _close_many(targets):
+    """Close (repo, number) pairs concurrently behind one progress line, then summarise."""
+    if not targets:
+        return
+    sem = asyncio.Semaphore(_CLOSE_CONCURRENCY)
+
+    async def _close_one(repo, num):
+        async with sem:
+            return num, await asyncio.to_thread(close_issue, repo, num)
+
+    total = len(targets)
+    failed = []
+    for done, job in enumerate(
+        asyncio.as_completed([_close_one(r, n) for r, n in targets]), 1,
+    ):
+        num, result = await job
+        if result is None:
+            failed.append(num)
+        sys.stdout.write(f"\r  {DIM}Closing {done}/{total}...{RESET}")
+        sys.stdout.flush()
+
+    # The cached lists still contain the closed issues
+    _ISSUES_CACHE.clear()
+    sys.stdout.write("\r\033[K")
+    if failed:
+        print(f"  {YELLOW}Closed {total - len(failed)}/{total} issues ({len(failed)} failed){RESET}")
+        print(f"  {RED}❌ Failed: {', '.join(f'#{n}' for n in sorted(failed))}{RESET}")
+    else:
+        print(f"  {GREEN}✅ Closed {total}/{total} issues.{RESET}")
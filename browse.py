@@ -2,18 +2,62 @@
 browse — Fetch, browse, and edit existing GitHub issues.
 """
 
-from .config import ORG, BOARDS
+import functools
+import io
+import sys
+import webbrowser
+from concurrent.futures import Future
+
+from .config import ORG, BOARDS, BOARD_KEYS, BOARD_SEARCH_INDEX
 from .ui import (
     BOLD, CYAN, DIM, GREEN, YELLOW, RED, MAGENTA, RESET,
-    BACK, QUIT,
-    clear, banner, nav_hint, prompt, pick_one, multiline, yn,
+    BACK, BANNER, CLEAR, QUIT,
+    clear, banner, nav_hint, prompt, pick_one, multiline, pause, yn,
 )
+from .cache import cached, daemon_future, open_cache
 from .gh import (
-    fetch_issues, fetch_issue_detail, update_issue,
-    close_issue, reopen_issue, add_issue_comment, fetch_labels,
+    fetch_issues, fetch_issue_detail, fetch_issue_details_batch, update_issue,
+    close_issue, reopen_issue, add_issue_comment, fetch_labels, label_names,
+    invalidate_reads, on_invalidate,
 )
 
 
+# ── Lookup cache ─────────────────────────────────────────────────────────
+# Lookups are cached briefly so moving between the list and an issue doesn't
+# refetch. Any edit drops the repo's entries, and gh.invalidate_reads() (the
+# list's refresh action) drops them all.
+
+_cache = open_cache("browse", maxsize=128, ttl=30)
+on_invalidate(_cache.clear)
+
+
+def _invalidate(repo):
+    """Forget every cached lookup for repo."""
+    _cache.invalidate(lambda key: key[1] == repo)
+
+
+def _invalidating(fn):
+    """Wrap a gh mutation so it invalidates its repo's cached lookups."""
+    @functools.wraps(fn)
+    def wrapper(repo, *args, **kwargs):
+        try:
+            return fn(repo, *args, **kwargs)
+        finally:
+            _invalidate(repo)
+    return wrapper
+
+
+# Listed issues' details are fetched in the background, in one GraphQL
+# query, while the user reads the list: opening one is the usual next step.
+fetch_issues = cached(_cache)(fetch_issues)
+fetch_issue_detail = cached(_cache)(fetch_issue_detail)
+fetch_labels = cached(_cache)(fetch_labels)
+update_issue = _invalidating(update_issue)
+close_issue = _invalidating(close_issue)
+reopen_issue = _invalidating(reopen_issue)
+add_issue_comment = _invalidating(add_issue_comment)
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 # ISSUE BROWSER — entry point
 # ═════════════════════════════════════════════════════════════════════════════
@@ -34,7 +78,7 @@ def browse_issues():
     raw = prompt("Choose repo (1/2)")
     if raw in (BACK, QUIT):
         return
-    keys = list(BOARDS.keys())
+    keys = BOARD_KEYS
     board_key = None
     try:
         idx = int(raw) - 1
@@ -42,8 +86,9 @@ def browse_issues():
             board_key = keys[idx]
     except (ValueError, TypeError):
         if raw:
-            for k, b in BOARDS.items():
-                if raw.lower() in b["repo"].lower() or k.lower().startswith(raw.lower()):
+            q = raw.lower()
+            for k, repo_lower, key_lower in BOARD_SEARCH_INDEX:
+                if q in repo_lower or key_lower.startswith(q):
                     board_key = k
                     break
     if not board_key:
@@ -57,49 +102,72 @@ def browse_issues():
 # ISSUE LIST
 # ═════════════════════════════════════════════════════════════════════════════
 
+_LIST_ACTIONS = (
+    f"  {DIM}─────────────────────────────────────────────────────{RESET}\n"
+    f"    {CYAN}#N{RESET}  Open issue by number    "
+    f"{CYAN}s{RESET}  Search    "
+    f"{CYAN}f{RESET}  Toggle state filter\n"
+    f"    {CYAN}r{RESET}   Refresh                 "
+    f"{CYAN}b{RESET}  Back      "
+    f"{CYAN}q{RESET}  Quit\n"
+    f"\n"
+)
+
+
+def _render_list_header(repo, board, state_filter, search_term):
+    """The list screen's title and active filters."""
+    filter_parts = [f"state={state_filter}"]
+    if search_term:
+        filter_parts.append(f"search=\"{search_term}\"")
+    return (
+        f"  {BOLD}📋 Issues — {repo.split('/')[-1]}{RESET}  {DIM}→ {board['name']}{RESET}\n"
+        f"  {DIM}Filters: {', '.join(filter_parts)}{RESET}\n\n"
+    )
+
+
+def _render_list(header, issues):
+    """Render the full list screen: banner, header, issue table and actions."""
+    table = _format_issue_table(issues) if issues else f"\n    {DIM}No issues found.{RESET}\n\n"
+    return f"{CLEAR}{BANNER}{header}{table}{_LIST_ACTIONS}"
+
+
 def _issue_list_loop(repo, board_key):
     """Show a paginated/filtered list of issues; let user pick one."""
     state_filter = "open"
     search_term = None
     limit = 30
+    prefetched = []
 
     while True:
-        clear()
-        banner()
         board = BOARDS[board_key]
-        print(f"  {BOLD}📋 Issues — {repo.split('/')[-1]}{RESET}  {DIM}→ {board['name']}{RESET}")
-        filter_parts = [f"state={state_filter}"]
-        if search_term:
-            filter_parts.append(f"search=\"{search_term}\"")
-        print(f"  {DIM}Filters: {', '.join(filter_parts)}{RESET}\n")
-
-        print(f"  {DIM}⏳ Fetching issues...{RESET}")
-        issues = fetch_issues(repo, state=state_filter, limit=limit, search=search_term)
-
-        if not issues:
-            print(f"\n    {DIM}No issues found.{RESET}\n")
-        else:
-            _print_issue_table(issues)
-
-        # ── Actions ──────────────────────────────────────────────────────
-        print(f"  {DIM}─────────────────────────────────────────────────────{RESET}")
-        print(f"    {CYAN}#N{RESET}  Open issue by number    "
-              f"{CYAN}s{RESET}  Search    "
-              f"{CYAN}f{RESET}  Toggle state filter")
-        print(f"    {CYAN}r{RESET}   Refresh                 "
-              f"{CYAN}b{RESET}  Back      "
-              f"{CYAN}q{RESET}  Quit")
-        print()
+        header = _render_list_header(repo, board, state_filter, search_term)
+        fetch_args = (repo,)
+        fetch_kwargs = {"state": state_filter, "limit": limit, "search": search_term}
+        if _cache.get(fetch_issues.key(*fetch_args, **fetch_kwargs)) is None:
+            sys.stdout.write(f"{CLEAR}{BANNER}{header}  {DIM}⏳ Fetching issues...{RESET}\n")
+            sys.stdout.flush()
+        issues = fetch_issues(*fetch_args, **fetch_kwargs)
+
+        if issues:
+            prefetched = [f for f in prefetched if not f.done()]
+            prefetched += _prefetch_details(repo, [i["number"] for i in issues])
+
+        # The whole frame goes out in one write
+        sys.stdout.write(_render_list(header, issues))
+        sys.stdout.flush()
 
         raw = prompt("Action or issue #")
-        if raw in (QUIT, None):
-            return
-        if raw == BACK:
+        if raw in (QUIT, BACK, None):
+            for future in prefetched:
+                future.cancel()
             return
 
         low = raw.lower().strip() if raw else ""
 
         if low == "r":
+            # A refresh must reach GitHub: this clears gh's caches and every
+            # module cache registered with it, this one included
+            invalidate_reads()
             continue  # refresh
 
         elif low == "s":
@@ -139,17 +207,58 @@ def _issue_list_loop(repo, board_key):
             prompt("Press enter")
 
 
-def _print_issue_table(issues):
-    """Print a numbered table of issues."""
-    max_num = max(len(str(i["number"])) for i in issues)
+def _prefetch_details(repo, numbers):
+    """Start one background batch fetch for the uncached issue numbers.
+
+    Each number gets its own Future in the cache, so fetch_issue_detail waits
+    for the batch; numbers the batch doesn't return resolve to None, and
+    fetch_issue_detail then falls back to fetching them individually.
+    Returns the Futures, for cancellation.
+    """
+    futures = {}
+    for num in numbers:
+        key = fetch_issue_detail.key(repo, num)
+        if _cache.get(key) is None:
+            futures[num] = Future()
+            _cache.set(key, futures[num])
+    if not futures:
+        return []
+
+    def run():
+        pending = [n for n, f in futures.items() if f.set_running_or_notify_cancel()]
+        try:
+            details = fetch_issue_details_batch(repo, pending) if pending else {}
+        except (OSError, ValueError):  # transport or JSON trouble: fetch singly
+            details = {}
+        except BaseException as exc:
+            # Anything else is a bug; hand it to the waiters rather than hide it
+            for num in pending:
+                futures[num].set_exception(exc)
+            raise
+        for num in pending:
+            futures[num].set_result(details.get(num))
+
+    daemon_future(run)
+    return list(futures.values())
+
+
+_OPEN_ICON = f"{GREEN}●{RESET}"
+_CLOSED_ICON = f"{RED}●{RESET}"
+
+
+def _format_issue_table(issues):
+    """Format a numbered table of issues."""
+    max_num = len(str(max(i["number"] for i in issues)))
+    rows = []
     for idx, issue in enumerate(issues, 1):
         num = issue["number"]
         title = issue["title"]
-        labels = [l["name"] for l in issue.get("labels", [])] if issue.get("labels") else []
+        labels = label_names(issue)
         label_str = f"  {DIM}[{', '.join(labels)}]{RESET}" if labels else ""
-        state_icon = f"{GREEN}●{RESET}" if issue["state"] == "OPEN" else f"{RED}●{RESET}"
-        print(f"    {DIM}{idx:>3}{RESET}  {state_icon}  {CYAN}#{num:<{max_num}}{RESET}  {title}{label_str}")
-    print()
+        state_icon = _OPEN_ICON if issue["state"] == "OPEN" else _CLOSED_ICON
+        rows.append(f"    {DIM}{idx:>3}{RESET}  {state_icon}  {CYAN}#{num:<{max_num}}{RESET}  {title}{label_str}\n")
+    rows.append("\n")
+    return "".join(rows)
 
 
 def _parse_issue_number(raw):
@@ -167,34 +276,41 @@ def _parse_issue_number(raw):
 # ISSUE DETAIL
 # ═════════════════════════════════════════════════════════════════════════════
 
+def _detail_actions(state_action):
+    return (
+        f"\n  {BOLD}Actions:{RESET}\n\n"
+        f"    {CYAN}t{RESET}  Edit title\n"
+        f"    {CYAN}d{RESET}  Edit description (body)\n"
+        f"    {CYAN}l{RESET}  Edit labels\n"
+        f"    {CYAN}c{RESET}  Add comment\n"
+        f"{state_action}"
+        f"    {CYAN}w{RESET}  Open in browser\n"
+        f"    {CYAN}b{RESET}  Back to list\n"
+        f"\n"
+    )
+
+
+_DETAIL_ACTIONS_OPEN = _detail_actions(f"    {RED}x{RESET}  Close issue\n")
+_DETAIL_ACTIONS_CLOSED = _detail_actions(f"    {GREEN}o{RESET}  Reopen issue\n")
+
+
 def _issue_detail_loop(repo, board_key, number):
     """Show full issue detail and allow editing."""
     while True:
-        clear()
-        banner()
-
+        if _cache.get(fetch_issue_detail.key(repo, number)) is None:
+            sys.stdout.write(f"{CLEAR}{BANNER}  {DIM}⏳ Fetching #{number}...{RESET}\n")
+            sys.stdout.flush()
         issue = fetch_issue_detail(repo, number)
         if not issue:
             print(f"\n  {RED}Could not fetch issue #{number}.{RESET}\n")
             prompt("Press enter to return")
             return BACK
 
-        _print_issue_detail(issue)
-
-        # ── Action menu ──────────────────────────────────────────────────
-        is_open = (issue.get("state", "").upper() == "OPEN")
-        print(f"\n  {BOLD}Actions:{RESET}\n")
-        print(f"    {CYAN}t{RESET}  Edit title")
-        print(f"    {CYAN}d{RESET}  Edit description (body)")
-        print(f"    {CYAN}l{RESET}  Edit labels")
-        print(f"    {CYAN}c{RESET}  Add comment")
-        if is_open:
-            print(f"    {RED}x{RESET}  Close issue")
-        else:
-            print(f"    {GREEN}o{RESET}  Reopen issue")
-        print(f"    {CYAN}w{RESET}  Open in browser")
-        print(f"    {CYAN}b{RESET}  Back to list")
-        print()
+        # ── Issue and action menu, written as one frame ──────────────────
+        is_open = issue.state == "OPEN"
+        actions = _DETAIL_ACTIONS_OPEN if is_open else _DETAIL_ACTIONS_CLOSED
+        sys.stdout.write(f"{CLEAR}{BANNER}{_render_issue_detail(issue)}{actions}")
+        sys.stdout.flush()
 
         action = prompt("Action")
         if action in (QUIT, None):
@@ -217,59 +333,49 @@ def _issue_detail_loop(repo, board_key, number):
         elif low == "o" and not is_open:
             _reopen_issue(repo, number)
         elif low == "w":
-            url = issue.get("url", "")
-            if url:
-                import subprocess
-                subprocess.run(["open", url], capture_output=True)
+            if issue.url:
+                webbrowser.open(issue.url, new=2)
         elif low == "b":
             return BACK
 
 
-def _print_issue_detail(issue):
-    """Pretty-print a full issue."""
-    num = issue["number"]
-    title = issue["title"]
-    state = issue.get("state", "UNKNOWN").upper()
-    state_badge = f"{GREEN}OPEN{RESET}" if state == "OPEN" else f"{RED}CLOSED{RESET}"
-    url = issue.get("url", "")
-
-    labels = [l["name"] for l in issue.get("labels", [])] if issue.get("labels") else []
-    assignees = [a["login"] for a in issue.get("assignees", [])] if issue.get("assignees") else []
-
-    print(f"  {BOLD}#{num}  {YELLOW}{title}{RESET}  [{state_badge}]")
-    print(f"  {DIM}{url}{RESET}\n")
-
-    if labels:
-        print(f"    {BOLD}Labels:{RESET}    {', '.join(labels)}")
-    if assignees:
-        print(f"    {BOLD}Assignees:{RESET} {', '.join(assignees)}")
-    if issue.get("milestone"):
-        ms = issue["milestone"]
-        ms_title = ms.get("title", "") if isinstance(ms, dict) else str(ms)
-        if ms_title:
-            print(f"    {BOLD}Milestone:{RESET} {ms_title}")
-
-    body = issue.get("body", "") or "_(no body)_"
-    print(f"\n  {DIM}{'─' * 50}{RESET}")
-    for line in body.split("\n"):
-        print(f"  {DIM}│{RESET} {line}")
-    print(f"  {DIM}{'─' * 50}{RESET}")
-
-    comments = issue.get("comments", [])
+def _render_issue_detail(issue):
+    """Render a full Issue for display."""
+    buf = io.StringIO()
+    out = functools.partial(print, file=buf)
+
+    state_badge = f"{GREEN}OPEN{RESET}" if issue.state == "OPEN" else f"{RED}CLOSED{RESET}"
+
+    out(f"  {BOLD}#{issue.number}  {YELLOW}{issue.title}{RESET}  [{state_badge}]")
+    out(f"  {DIM}{issue.url}{RESET}\n")
+
+    if issue.labels:
+        out(f"    {BOLD}Labels:{RESET}    {', '.join(issue.labels)}")
+    if issue.assignees:
+        out(f"    {BOLD}Assignees:{RESET} {', '.join(issue.assignees)}")
+    if issue.milestone:
+        out(f"    {BOLD}Milestone:{RESET} {issue.milestone}")
+
+    body = issue.body or "_(no body)_"
+    out(f"\n  {DIM}{'─' * 50}{RESET}")
+    for line in body.splitlines():
+        out(f"  {DIM}│{RESET} {line}")
+    out(f"  {DIM}{'─' * 50}{RESET}")
+
+    comments = issue.comments
     if comments:
-        print(f"\n  {BOLD}💬 Comments ({len(comments)}):{RESET}\n")
+        out(f"\n  {BOLD}💬 Comments ({len(comments)}):{RESET}\n")
         for cm in comments[-5:]:  # show last 5
-            author = cm.get("author", {}).get("login", "unknown") if isinstance(cm.get("author"), dict) else "unknown"
-            created = cm.get("createdAt", "")[:10]
-            cm_body = cm.get("body", "")
             # Truncate long comments
-            lines = cm_body.split("\n")
+            lines = cm.body.splitlines()
             preview = "\n      ".join(lines[:4])
             if len(lines) > 4:
                 preview += f"\n      {DIM}... ({len(lines) - 4} more lines){RESET}"
-            print(f"    {CYAN}{author}{RESET}  {DIM}{created}{RESET}")
-            print(f"      {preview}")
-            print()
+            out(f"    {CYAN}{cm.author}{RESET}  {DIM}{cm.created}{RESET}")
+            out(f"      {preview}")
+            out()
+
+    return buf.getvalue()
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -281,13 +387,13 @@ def _edit_title(repo, number, issue):
     clear()
     banner()
     print(f"  {BOLD}✏️  Edit Title — #{number}{RESET}\n")
-    print(f"    Current: {YELLOW}{issue['title']}{RESET}\n")
+    print(f"    Current: {YELLOW}{issue.title}{RESET}\n")
     nav_hint()
 
-    new_title = prompt("New title", default=issue["title"])
+    new_title = prompt("New title", default=issue.title)
     if new_title in (BACK, QUIT) or not new_title:
         return
-    if new_title == issue["title"]:
+    if new_title == issue.title:
         print(f"    {DIM}No change.{RESET}")
         return
 
@@ -298,7 +404,7 @@ def _edit_title(repo, number, issue):
             print(f"  {GREEN}✅ Title updated.{RESET}")
         else:
             print(f"  {RED}❌ Failed to update title.{RESET}")
-        prompt("Press enter to continue")
+        pause()
 
 
 def _edit_body(repo, number, issue):
@@ -306,13 +412,14 @@ def _edit_body(repo, number, issue):
     clear()
     banner()
     print(f"  {BOLD}📝 Edit Body — #{number}{RESET}\n")
-    body = issue.get("body", "") or ""
+    body = issue.body
     if body:
         print(f"    {DIM}Current body:{RESET}")
-        for ln in body.split("\n")[:15]:
+        lines = body.splitlines()
+        for ln in lines[:15]:
             print(f"      {ln}")
-        if body.count("\n") > 15:
-            print(f"      {DIM}... ({body.count(chr(10)) - 15} more lines){RESET}")
+        if len(lines) > 15:
+            print(f"      {DIM}... ({len(lines) - 15} more lines){RESET}")
         print()
 
     print(f"  {DIM}Options:{RESET}")
@@ -343,7 +450,7 @@ def _edit_body(repo, number, issue):
             print(f"  {GREEN}✅ Body updated.{RESET}")
         else:
             print(f"  {RED}❌ Failed to update body.{RESET}")
-        prompt("Press enter to continue")
+        pause()
 
 
 def _edit_labels(repo, board_key, number, issue):
@@ -352,14 +459,14 @@ def _edit_labels(repo, board_key, number, issue):
     banner()
     print(f"  {BOLD}🏷️  Edit Labels — #{number}{RESET}\n")
 
-    current = [l["name"] for l in issue.get("labels", [])] if issue.get("labels") else []
+    current = issue.labels
     if current:
         print(f"    {BOLD}Current:{RESET} {', '.join(current)}\n")
     else:
         print(f"    {DIM}No labels set.{RESET}\n")
 
-    # Show all available labels
-    all_labels = fetch_labels(repo)
+    # Show all available labels (already present if the issue came from a batch prefetch)
+    all_labels = issue.repo_labels or fetch_labels(repo)
     if all_labels:
         current_set = {l.lower() for l in current}
         print(f"    {DIM}Available on {repo}:{RESET}")
@@ -391,12 +498,12 @@ def _edit_labels(repo, board_key, number, issue):
                     print(f"  {GREEN}✅ Labels added.{RESET}")
                 else:
                     print(f"  {RED}❌ Failed to add labels.{RESET}")
-                prompt("Press enter to continue")
+                pause()
 
     elif action == "remove":
         if not current:
             print(f"    {DIM}No labels to remove.{RESET}")
-            prompt("Press enter to continue")
+            pause()
             return
         raw = prompt("Labels to remove (comma-separated)")
         if raw in (BACK, QUIT) or not raw:
@@ -410,7 +517,7 @@ def _edit_labels(repo, board_key, number, issue):
                     print(f"  {GREEN}✅ Labels removed.{RESET}")
                 else:
                     print(f"  {RED}❌ Failed to remove labels.{RESET}")
-                prompt("Press enter to continue")
+                pause()
 
 
 def _add_comment(repo, number):
@@ -431,7 +538,7 @@ def _add_comment(repo, number):
             print(f"  {GREEN}✅ Comment added.{RESET}")
         else:
             print(f"  {RED}❌ Failed to add comment.{RESET}")
-        prompt("Press enter to continue")
+        pause()
 
 
 def _close_issue(repo, number):
@@ -443,7 +550,7 @@ def _close_issue(repo, number):
             print(f"  {GREEN}✅ Issue #{number} closed.{RESET}")
         else:
             print(f"  {RED}❌ Failed to close issue.{RESET}")
-        prompt("Press enter to continue")
+        pause()
 
 
 def _reopen_issue(repo, number):
@@ -455,4 +562,4 @@ def _reopen_issue(repo, number):
             print(f"  {GREEN}✅ Issue #{number} reopened.{RESET}")
         else:
             print(f"  {RED}❌ Failed to reopen issue.{RESET}")
-        prompt("Press enter to continue")
+        pause()
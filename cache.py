@@ -0,0 +1,234 @@
+"""
+cache — Small in-memory TTL + LRU cache for GitHub lookups.
+
+Entries expire `ttl` seconds after they were stored, and the least recently
+used entry is evicted once `maxsize` is exceeded. Keys are tuples; the
+`cached` decorator builds them as (function name, *args, *sorted kwargs).
+With ISSUE_PERSIST_CACHE=1, open_cache() also keeps entries in SQLite so
+they survive between runs.
+"""
+
+import functools
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
+
+from . import jsonio
+
+
+class TTLCache:
+    """An OrderedDict-backed LRU cache whose entries expire after `ttl` seconds.
+
+    Safe to share between threads (prefetch pools, fetch_many workers).
+    """
+
+    def __init__(self, maxsize=128, ttl=30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the live value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value):
+        self._store(key, value, time.monotonic())
+
+    def _store(self, key, value, stored_at):
+        with self._lock:
+            self._data[key] = (stored_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate(self, match):
+        """Drop every entry whose key satisfies match(key)."""
+        with self._lock:
+            for key in [k for k in self._data if match(k)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class PersistentTTLCache(TTLCache):
+    """A TTLCache that writes JSON-serialisable entries through to SQLite.
+
+    The CLI is a short-lived process, so a later run can start from the
+    previous run's lookups while they are still within `ttl`. Entries that
+    can't be stored as JSON (pending Futures, Issue objects) stay in memory.
+    """
+
+    def __init__(self, namespace, path, maxsize=128, ttl=30):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.namespace = namespace
+        self._db_lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "ns TEXT, key TEXT, payload BLOB, fetched_at REAL, PRIMARY KEY (ns, key))"
+        )
+
+    def get(self, key, default=None):
+        value = super().get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT payload, fetched_at FROM entries WHERE ns = ? AND key = ?",
+                (self.namespace, jsonio.dumps(key)),
+            ).fetchone()
+        if row is None:
+            return default
+        age = time.time() - row[1]
+        if not 0 <= age < self.ttl:
+            return default
+        value = jsonio.loads(row[0])
+        # Keep the stored expiry rather than restarting the TTL
+        self._store(key, value, time.monotonic() - age)
+        return value
+
+    def set(self, key, value):
+        super().set(key, value)
+        if not isinstance(value, (list, dict)):
+            return
+        try:
+            payload = jsonio.dumps(value)
+        except TypeError:
+            return
+        with self._db_lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (self.namespace, jsonio.dumps(key), payload, time.time()),
+            )
+
+    def discard(self, key):
+        super().discard(key)
+        with self._db_lock, self._db:
+            self._db.execute(
+                "DELETE FROM entries WHERE ns = ? AND key = ?",
+                (self.namespace, jsonio.dumps(key)),
+            )
+
+    def invalidate(self, match):
+        super().invalidate(match)
+        with self._db_lock, self._db:
+            rows = self._db.execute(
+                "SELECT key FROM entries WHERE ns = ?", (self.namespace,),
+            ).fetchall()
+            stale = [(self.namespace, k) for (k,) in rows if match(tuple(jsonio.loads(k)))]
+            self._db.executemany("DELETE FROM entries WHERE ns = ? AND key = ?", stale)
+
+    def clear(self):
+        super().clear()
+        with self._db_lock, self._db:
+            self._db.execute("DELETE FROM entries WHERE ns = ?", (self.namespace,))
+
+
+_MISSING = object()
+_CACHE_DB = os.path.expanduser("~/.issue/cache.sqlite")
+
+
+def open_cache(namespace, maxsize=128, ttl=30):
+    """A TTLCache, persisted to ~/.issue/cache.sqlite when ISSUE_PERSIST_CACHE=1."""
+    if os.getenv("ISSUE_PERSIST_CACHE") == "1":
+        try:
+            return PersistentTTLCache(namespace, _CACHE_DB, maxsize=maxsize, ttl=ttl)
+        except (OSError, sqlite3.Error):
+            pass
+    return TTLCache(maxsize=maxsize, ttl=ttl)
+
+
+def daemon_future(fn, *args, **kwargs):
+    """Run fn(*args, **kwargs) on a daemon thread; return a Future for its result.
+
+    Executor workers are joined at interpreter exit, so quitting would wait
+    on a slow background fetch (gh CLI calls have no timeout); a daemon
+    thread is simply abandoned.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:  # noqa: BLE001 — re-raised by future.result()
+            future.set_exception(exc)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def cached(cache):
+    """Memoise a function's non-None results in cache.
+
+    None is never stored, since the gh wrappers return it on failure. The
+    wrapper's prefetch(*args, **kwargs) starts the call on a daemon thread
+    and caches its Future, which a later call waits on instead
+    of fetching again; a Future that is cancelled, fails with a transport or
+    JSON error (OSError, ValueError) or yields None is retried in the
+    foreground, and any other exception is raised to the caller. wrapper.key(*args, **kwargs) gives the cache key, for
+    callers that store their own Futures (e.g. from a batch fetch).
+    """
+    def decorator(fn):
+        name = fn.__name__
+
+        def key_for(*args, **kwargs):
+            return (name, *args, *sorted(kwargs.items()))
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = key_for(*args, **kwargs)
+            value = cache.get(key)
+            if isinstance(value, Future):
+                try:
+                    value = value.result()
+                except (CancelledError, OSError, ValueError):
+                    value = None
+                except Exception:
+                    cache.discard(key)  # don't keep re-raising a stored failure
+                    raise
+            elif value is not None:
+                return value
+            if value is None:
+                value = fn(*args, **kwargs)
+            if value is None:
+                cache.discard(key)
+            else:
+                cache.set(key, value)
+            return value
+
+        def prefetch(*args, **kwargs):
+            """Start fn(*args, **kwargs) in the background unless already cached. Returns the Future or None."""
+            key = key_for(*args, **kwargs)
+            if cache.get(key) is not None:
+                return None
+            future = daemon_future(fn, *args, **kwargs)
+            cache.set(key, future)
+            return future
+
+        wrapper.key = key_for
+        wrapper.prefetch = prefetch
+        return wrapper
+    return decorator
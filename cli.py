@@ -3,59 +3,77 @@ cli — Argparse entry point, quick mode, and interactive main menu.
 """
 
 import argparse
-import asyncio
+import functools
+import importlib.util
 import sys
 import textwrap
 
-from .config import ORG, DEFAULT_REPO, BOARDS
+from .config import ORG, DEFAULT_REPO, BOARDS, BOARD_KEYS
 from .ui import (
     BOLD, CYAN, DIM, MAGENTA, RESET,
-    QUIT, clear, banner, prompt,
+    BANNER, CLEAR, QUIT, prompt,
 )
 from .wizard import wizard_create, execute_create
-from .views import view_boards, view_labels, view_iterations
+from .views import view_boards, view_labels, view_iterations, warm as warm_views
 from .browse import browse_issues
-from .gh import fetch_current_iteration
+from .gh import fetch_current_iteration, fetch_iterations, fetch_labels, fetch_many
 
 
 # ═════════════════════════════════════════════════════════════════════════════
 # MAIN MENU
 # ═════════════════════════════════════════════════════════════════════════════
 
+# The menu screen is static apart from the AI block, so both variants are
+# rendered once and written in a single call.
+_MENU_HEAD = (
+    f"{CLEAR}{BANNER}"
+    f"  {BOLD}What would you like to do?{RESET}\n\n"
+    f"    {CYAN}1{RESET}  Create an issue\n"
+    f"    {CYAN}2{RESET}  Browse & edit issues\n"
+    f"    {CYAN}3{RESET}  View boards & fields\n"
+    f"    {CYAN}4{RESET}  View labels\n"
+    f"    {CYAN}5{RESET}  View iterations\n"
+    f"    {CYAN}6{RESET}  📋 This week / top todos  {DIM}(kanban dashboard){RESET}\n"
+    f"    {CYAN}0{RESET}  🌐 Open kanban board  {DIM}(web UI){RESET}\n"
+    f"  {DIM}────── AI ──────{RESET}\n"
+)
+_MENU_TAIL = f"    {CYAN}q{RESET}  Quit\n\n"
+_MENU_WITH_AI = (
+    _MENU_HEAD
+    + f"    {MAGENTA}7{RESET}  {MAGENTA}✨ AI-assisted issue{RESET}  {DIM}(Copilot reads your docs){RESET}\n"
+    + f"    {MAGENTA}8{RESET}  {MAGENTA}💬 Ask Copilot{RESET}  {DIM}(chat about your projects){RESET}\n"
+    + f"    {MAGENTA}9{RESET}  {MAGENTA}🔬 Analyse backlog{RESET}  {DIM}(duplicates, priorities, risks){RESET}\n"
+    + _MENU_TAIL
+)
+_MENU_WITHOUT_AI = (
+    _MENU_HEAD
+    + f"    {DIM}7   ✨ AI-assisted issue  (copilot SDK not available){RESET}\n"
+    + f"    {DIM}8   💬 Ask Copilot        (copilot SDK not available){RESET}\n"
+    + f"    {DIM}9   🔬 Analyse backlog    (copilot SDK not available){RESET}\n"
+    + _MENU_TAIL
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _ai_available():
+    """Whether the optional `copilot` SDK is installed.
+
+    find_spec only locates the package without importing it; the ai/analyse
+    modules themselves are only imported when an AI action is picked.
+    """
+    try:
+        return importlib.util.find_spec("copilot") is not None
+    except (ImportError, ValueError):
+        return False
+
+
 def main_menu():
     """Top-level interactive menu loop."""
-    # AI features are optional — they require the `copilot` SDK which may
-    # not be installed in every Python environment.
-    try:
-        import copilot as _copilot_mod  # noqa: F401 — probe only
-        from .ai import wizard_ai_issue, copilot_chat
-        from .analyse import analyse_backlog
-        _has_ai = True
-    except (ImportError, ModuleNotFoundError):
-        _has_ai = False
+    _has_ai = _ai_available()
+    warm_views()
 
     while True:
-        clear()
-        banner()
-        print(f"  {BOLD}What would you like to do?{RESET}\n")
-        print(f"    {CYAN}1{RESET}  Create an issue")
-        print(f"    {CYAN}2{RESET}  Browse & edit issues")
-        print(f"    {CYAN}3{RESET}  View boards & fields")
-        print(f"    {CYAN}4{RESET}  View labels")
-        print(f"    {CYAN}5{RESET}  View iterations")
-        print(f"    {CYAN}6{RESET}  📋 This week / top todos  {DIM}(kanban dashboard){RESET}")
-        print(f"    {CYAN}0{RESET}  🌐 Open kanban board  {DIM}(web UI){RESET}")
-        print(f"  {DIM}────── AI ──────{RESET}")
-        if _has_ai:
-            print(f"    {MAGENTA}7{RESET}  {MAGENTA}✨ AI-assisted issue{RESET}  {DIM}(Copilot reads your docs){RESET}")
-            print(f"    {MAGENTA}8{RESET}  {MAGENTA}💬 Ask Copilot{RESET}  {DIM}(chat about your projects){RESET}")
-            print(f"    {MAGENTA}9{RESET}  {MAGENTA}🔬 Analyse backlog{RESET}  {DIM}(duplicates, priorities, risks){RESET}")
-        else:
-            print(f"    {DIM}7   ✨ AI-assisted issue  (copilot SDK not available){RESET}")
-            print(f"    {DIM}8   💬 Ask Copilot        (copilot SDK not available){RESET}")
-            print(f"    {DIM}9   🔬 Analyse backlog    (copilot SDK not available){RESET}")
-        print(f"    {CYAN}q{RESET}  Quit")
-        print()
+        sys.stdout.write(_MENU_WITH_AI if _has_ai else _MENU_WITHOUT_AI)
 
         choice = prompt("Choose")
         if choice in (QUIT, None, "q"):
@@ -84,7 +102,8 @@ def main_menu():
                 prompt("Press enter to return")
         elif choice == "7":
             if _has_ai:
-                asyncio.run(wizard_ai_issue())
+                from .ai import run_ai, wizard_ai_issue
+                run_ai(wizard_ai_issue())
             else:
                 from .ui import RED
                 print(f"\n  {RED}The copilot SDK is not installed in this Python environment.{RESET}")
@@ -92,7 +111,8 @@ def main_menu():
                 prompt("Press enter to return")
         elif choice == "8":
             if _has_ai:
-                asyncio.run(copilot_chat())
+                from .ai import run_ai, copilot_chat
+                run_ai(copilot_chat())
             else:
                 from .ui import RED
                 print(f"\n  {RED}The copilot SDK is not installed in this Python environment.{RESET}")
@@ -100,7 +120,9 @@ def main_menu():
                 prompt("Press enter to return")
         elif choice == "9":
             if _has_ai:
-                asyncio.run(analyse_backlog())
+                from .ai import run_ai
+                from .analyse import analyse_backlog
+                run_ai(analyse_backlog())
             else:
                 from .ui import RED
                 print(f"\n  {RED}The copilot SDK is not installed in this Python environment.{RESET}")
@@ -112,6 +134,17 @@ def main_menu():
 # QUICK MODE (non-interactive, for scripting / Copilot)
 # ═════════════════════════════════════════════════════════════════════════════
 
+# Single-select fields settable by quick-mode flags, per board
+_QUICK_FLAGS = ("priority", "size", "epic", "status", "team")
+_QUICK_FIELDS_BY_BOARD = {
+    key: tuple(
+        f for f in _QUICK_FLAGS
+        if f in board["fields"] and "options" in board["fields"][f]
+    )
+    for key, board in BOARDS.items()
+}
+
+
 def quick_create(args):
     """Create from CLI arguments without prompts."""
     board_key = args.board
@@ -135,22 +168,22 @@ def quick_create(args):
         "fields": {},
     }
 
-    flag_map = {
-        "priority": args.priority,
-        "size": args.size,
-        "epic": args.epic,
-        "status": args.status,
-        "team": args.team,
-    }
-    for fkey, fval in flag_map.items():
-        if fval and fkey in board["fields"]:
-            v = fval.lower()
-            opts = board["fields"][fkey]["options"]
-            if v in opts:
-                state["fields"][fkey] = (board["fields"][fkey]["id"], opts[v], "single_select")
+    for fkey in _QUICK_FIELDS_BY_BOARD[board_key]:
+        fval = getattr(args, fkey)
+        if fval:
+            fdata = board["fields"][fkey]
+            opt = fdata["options"].get(fval.lower())
+            if opt:
+                state["fields"][fkey] = (fdata["id"], opt, "single_select")
 
     if args.current_iteration and "iteration" in board["fields"]:
-        iter_id, iter_title = fetch_current_iteration(board_key)
+        # The labels are fetched alongside so execute_create's label check
+        # is answered from gh's read cache instead of a second round trip.
+        if state["labels"]:
+            iterations, _ = fetch_many((fetch_iterations, board_key), (fetch_labels, repo))
+        else:
+            iterations = fetch_iterations(board_key)
+        iter_id, iter_title = fetch_current_iteration(board_key, iterations or [])
         if iter_id:
             state["fields"]["iteration"] = (board["fields"]["iteration"]["id"], iter_id, "iteration")
 
@@ -183,7 +216,7 @@ def main():
     sub.add_parser("board", help="Open the kanban board web UI")
 
     p_create = sub.add_parser("create", help="Create a new issue (quick mode with flags)")
-    p_create.add_argument("--board", choices=list(BOARDS.keys()))
+    p_create.add_argument("--board", choices=BOARD_KEYS)
     p_create.add_argument("--repo", default=DEFAULT_REPO)
     p_create.add_argument("--title")
     p_create.add_argument("--description")
@@ -13,6 +13,7 @@ If no config file exists, built-in defaults are used.
 import json
 import os
 import sys
+from types import MappingProxyType
 
 
 WORKSPACE = os.getenv(
@@ -81,5 +82,42 @@ _CONFIG = _load_config()
 
 ORG = _CONFIG.get("org", _DEFAULT_CONFIG["org"])
 DEFAULT_REPO = _CONFIG.get("default_repo", _DEFAULT_CONFIG["default_repo"])
-BOARDS = _CONFIG.get("boards", _DEFAULT_CONFIG["boards"])
+
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only MappingProxyType views (lists become tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _prepare_boards(boards):
+    """Lowercase single-select option keys once, then freeze the boards.
+
+    Option lookups (quick mode flags, AI drafts) lowercase their input, so
+    the keys are normalised here rather than at every lookup.
+    """
+    prepared = {}
+    for key, board in boards.items():
+        board = dict(board)
+        fields = {}
+        for fkey, fdata in (board.get("fields") or {}).items():
+            if isinstance(fdata, dict) and isinstance(fdata.get("options"), dict):
+                fdata = {**fdata, "options": {str(k).lower(): v for k, v in fdata["options"].items()}}
+            fields[fkey] = fdata
+        board["fields"] = fields
+        prepared[key] = board
+    return _freeze(prepared)
+
+
+BOARDS = _prepare_boards(_CONFIG.get("boards", _DEFAULT_CONFIG["boards"]))
+BOARD_KEYS = tuple(BOARDS)
+# (key, lowercased repo, lowercased key) for matching typed board/repo names
+BOARD_SEARCH_INDEX = tuple((k, b["repo"].lower(), k.lower()) for k, b in BOARDS.items())
 AI_MODEL = _CONFIG.get("ai_model", _DEFAULT_CONFIG["ai_model"])
+
+# False when stdin isn't a terminal or ISSUE_INTERACTIVE=0: acknowledgement
+# pauses are skipped so scripted runs don't stall.
+INTERACTIVE = sys.stdin.isatty() and os.getenv("ISSUE_INTERACTIVE", "1") != "0"
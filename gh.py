@@ -2,85 +2,422 @@
 gh — GitHub CLI wrappers, GraphQL helpers, and data fetchers.
 """
 
+import asyncio
+import atexit
 import datetime
-import json
+import functools
+import http.client
+import os
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
 
+from . import jsonio
+from .cache import open_cache
 from .config import ORG, BOARDS
 from .ui import RED, GREEN, RESET
 
 
+# ── Read cache ───────────────────────────────────────────────────────────
+# Reads (issue lists and views, non-mutation GraphQL) are answered from a
+# short-lived cache so repeated lookups within a session don't spawn gh or
+# hit the API again. Labels and iterations change rarely and keep longer.
+# Any mutation clears both, so a read after an edit is always fresh;
+# user-requested refreshes clear them through invalidate_reads().
+
+_READ_VERBS = frozenset({("issue", "list"), ("issue", "view"), ("label", "list")})
+_read_cache = open_cache("gh", maxsize=128, ttl=60)
+_lookup_cache = open_cache("gh-lookups", maxsize=32, ttl=300)
+
+
+_inflight = {}  # cache key -> Future of the fetch currently running for it
+_inflight_lock = threading.Lock()
+
+
+def _read_through(cache, key, fetch):
+    """Return cache[key], or fetch() and store it unless it failed (None).
+
+    Concurrent misses on the same key (e.g. from fetch_many or background
+    prefetches) share one fetch: the first caller runs it, the others wait
+    for its result.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+    with _inflight_lock:
+        pending = _inflight.get(key)
+        owner = pending is None
+        if owner:
+            pending = _inflight[key] = Future()
+    if not owner:
+        return pending.result()
+    try:
+        value = fetch()
+        if value is not None:
+            cache.set(key, value)
+    except BaseException as exc:
+        pending.set_exception(exc)
+        raise
+    else:
+        pending.set_result(value)
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+    return value
+
+
+_invalidate_hooks = []
+
+
+def on_invalidate(hook):
+    """Have invalidate_reads() also call hook(), e.g. a module cache's clear."""
+    _invalidate_hooks.append(hook)
+    return hook
+
+
+def invalidate_reads():
+    """Drop every cached read and lookup, so the next call goes to GitHub."""
+    _read_cache.clear()
+    _lookup_cache.clear()
+    for hook in _invalidate_hooks:
+        hook()
+
+
 # ── Low-level gh CLI ─────────────────────────────────────────────────────
 
 def gh(*args, json_output=False):
+    if args[:2] in _READ_VERBS:
+        return _read_through(
+            _read_cache, ("gh", *args, json_output),
+            lambda: _gh_run(args, json_output),
+        )
+    invalidate_reads()
+    return _gh_run(args, json_output)
+
+
+def _gh_run(args, json_output):
+    # Output stays as bytes so JSON is parsed straight from them
     cmd = ["gh"] + list(args)
-    r = subprocess.run(cmd, capture_output=True, text=True)
+    r = subprocess.run(cmd, capture_output=True)
     if r.returncode != 0:
-        print(f"  {RED}❌ gh error: {r.stderr.strip()}{RESET}", file=sys.stderr)
+        print(f"  {RED}❌ gh error: {r.stderr.decode(errors='replace').strip()}{RESET}", file=sys.stderr)
         return None
     if json_output:
-        return json.loads(r.stdout)
-    return r.stdout.strip()
+        return jsonio.loads(r.stdout)
+    return r.stdout.decode().strip()
+
+
+# ── Concurrent fetches ───────────────────────────────────────────────────
+
+def fetch_many(*calls):
+    """Run independent fetches concurrently. Returns their results in order.
+
+    Each call is a (fn, *args) tuple; fn runs in a worker thread, so the
+    wall time is the slowest call rather than the sum. A call that raises
+    yields None instead of sinking the others.
+    """
+    async def run():
+        return await asyncio.gather(
+            *(asyncio.to_thread(fn, *args) for fn, *args in calls),
+            return_exceptions=True,
+        )
+    return [None if isinstance(r, BaseException) else r for r in asyncio.run(run())]
+
+
+# ── Persistent API connection ────────────────────────────────────────────
+# GraphQL and REST calls go straight to the API over a keep-alive HTTPS
+# connection per thread (http.client connections aren't thread-safe), so the
+# TCP+TLS handshake is paid once instead of once per `gh` process. The token
+# comes from gh; without one (or on GitHub Enterprise hosts) calls go
+# through the gh CLI as before. Requests that fail in transport are
+# reported as failed, not re-sent through the CLI.
+
+_API_HOST = "api.github.com"
+_conn_local = threading.local()
+_connections = []
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_token():
+    if os.environ.get("GH_HOST", "github.com") != "github.com":
+        return None
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    r = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True)
+    if r.returncode != 0:
+        return None
+    return r.stdout.strip() or None
 
 
-def gh_graphql(query):
-    r = subprocess.run(
-        ["gh", "api", "graphql", "-f", f"query={query}"],
-        capture_output=True, text=True,
+# Methods that are safe to send twice. Others (POST, PATCH) are never
+# retried once sent: the first attempt may have been applied before the
+# connection failed, and a retried issue create would duplicate the issue.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+# Servers drop idle keep-alive connections; a non-idempotent request after
+# this many idle seconds starts on a fresh connection instead of risking it
+_FRESH_CONN_AFTER = 5
+
+
+def _api_request(method, path, body=None, headers=None, *, idempotent=None):
+    """Send a request on this thread's connection.
+
+    Returns (status, headers, body), or None when there is no API token
+    (callers then fall back to the gh CLI). A transport failure comes back
+    as status 0 rather than None, so it is reported instead of repeated
+    through the CLI. idempotent defaults from the method; GraphQL queries
+    pass True.
+    """
+    token = _auth_token()
+    if not token:
+        return None
+    if idempotent is None:
+        idempotent = method in _IDEMPOTENT_METHODS
+    hdrs = {
+        "Authorization": f"bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "issue-manager-cli",
+    }
+    if headers:
+        hdrs.update(headers)
+    now = time.monotonic()
+    if not idempotent and now - getattr(_conn_local, "used_at", now) > _FRESH_CONN_AFTER:
+        _drop_connection()
+    # A kept-alive connection may have been dropped by the server: idempotent
+    # requests are retried once on a new one
+    for _ in range(2 if idempotent else 1):
+        conn = getattr(_conn_local, "conn", None)
+        if conn is None:
+            conn = _conn_local.conn = http.client.HTTPSConnection(_API_HOST, timeout=30)
+            _connections.append(conn)
+        try:
+            conn.request(method, path, body=body, headers=hdrs)
+            resp = conn.getresponse()
+            result = resp.status, resp.headers, resp.read()
+        except (OSError, http.client.HTTPException):
+            _drop_connection()
+            continue
+        _conn_local.used_at = time.monotonic()
+        return result
+    return 0, {}, b"connection failed"
+
+
+def _drop_connection():
+    conn = getattr(_conn_local, "conn", None)
+    if conn is not None:
+        conn.close()
+    _conn_local.conn = None
+
+
+@atexit.register
+def _close_connections():
+    for conn in _connections:
+        conn.close()
+
+
+def gh_graphql(query, variables=None, *, cache=_read_cache):
+    """Run a GraphQL query with optional variables.
+
+    Queries are cached in cache, keyed by the query text and variables;
+    mutations clear the read caches.
+    """
+    variables = variables or {}
+    if query.lstrip().startswith("mutation"):
+        invalidate_reads()
+        return _graphql_run(query, variables)
+    key = ("graphql", query, jsonio.dumps(variables))
+    return _read_through(cache, key, lambda: _graphql_run(query, variables))
+
+
+def _graphql_run(query, variables):
+    resp = _api_request(
+        "POST", "/graphql", jsonio.dumps({"query": query, "variables": variables}).encode(),
+        {"Content-Type": "application/json"},
+        idempotent=not query.lstrip().startswith("mutation"),
     )
+    if resp is not None:
+        status, _, raw = resp
+        try:
+            data = jsonio.loads(raw)
+        except ValueError:
+            data = None
+        if status == 200 and data and not data.get("errors"):
+            return data
+        detail = (data or {}).get("errors") or (data or {}).get("message") or f"HTTP {status}"
+        print(f"  {RED}❌ GraphQL error: {detail}{RESET}", file=sys.stderr)
+        return None
+
+    # gh api sends non-query fields as variables: -F for typed values
+    # (ints), -f for strings, key[sub]=value for input objects
+    cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+    for name, value in variables.items():
+        if isinstance(value, dict):
+            for sub, v in value.items():
+                cmd.extend(["-f", f"{name}[{sub}]={v}"])
+        else:
+            cmd.extend(["-F" if isinstance(value, int) else "-f", f"{name}={value}"])
+    r = subprocess.run(cmd, capture_output=True)
+    if r.returncode != 0:
+        print(f"  {RED}❌ GraphQL error: {r.stderr.decode(errors='replace').strip()}{RESET}", file=sys.stderr)
+        return None
+    return jsonio.loads(r.stdout)
+
+
+# (REST path,) -> [etag, payload] of its last 200 response. A stale entry
+# only costs a full response, so it is kept for a week, and with
+# ISSUE_PERSIST_CACHE=1 across runs: a new session then revalidates
+# instead of downloading the labels again.
+_etags = open_cache("etags", maxsize=64, ttl=7 * 24 * 3600)
+
+
+def gh_api_conditional(path):
+    """GET a REST path, revalidating the previous response with If-None-Match.
+
+    A 304 reuses the stored payload and doesn't count against the rate limit.
+    Only for REST endpoints; `gh issue list` and GraphQL queries have no
+    ETags to replay.
+    """
+    prev = _etags.get((path,))
+    resp = _api_request("GET", f"/{path}", headers={"If-None-Match": prev[0]} if prev else None)
+    if resp is not None:
+        status, headers, raw = resp
+        if status == 304 and prev:
+            return prev[1]
+        if status != 200:
+            print(f"  {RED}❌ gh error: HTTP {status} {raw[:200].decode(errors='replace')}{RESET}", file=sys.stderr)
+            return None
+        payload = jsonio.loads(raw)
+        if headers.get("ETag"):
+            _etags.set((path,), [headers["ETag"], payload])
+        return payload
+
+    cmd = ["gh", "api", "--include", path]
+    if prev:
+        cmd[2:2] = ["-H", f"If-None-Match: {prev[0]}"]
+    r = subprocess.run(cmd, capture_output=True, text=True)
+    head, _, body = r.stdout.replace("\r\n", "\n").partition("\n\n")
+    status_line, *header_lines = head.split("\n")
+    status = status_line.split()[1] if len(status_line.split()) > 1 else ""
+    if status == "304" and prev:
+        return prev[1]
     if r.returncode != 0:
-        print(f"  {RED}❌ GraphQL error: {r.stderr.strip()}{RESET}", file=sys.stderr)
+        print(f"  {RED}❌ gh error: {r.stderr.strip()}{RESET}", file=sys.stderr)
         return None
-    return json.loads(r.stdout)
+    payload = jsonio.loads(body)
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "etag":
+            _etags.set((path,), [value.strip(), payload])
+            break
+    return payload
+
+
+# ── Project item mutations ───────────────────────────────────────────────
+
+_ADD_ITEM_MUTATION = """
+mutation($project: ID!, $content: ID!) {
+  addProjectV2ItemById(input: {projectId: $project, contentId: $content}) { item { id } }
+}
+"""
+
+
+def add_to_project(project_id, content_id):
+    """Add an issue (by node id) to a project. Returns the item id, or None."""
+    data = gh_graphql(_ADD_ITEM_MUTATION, {"project": project_id, "content": content_id})
+    added = ((data or {}).get("data") or {}).get("addProjectV2ItemById") or {}
+    return (added.get("item") or {}).get("id")
+
 
+_FIELD_VALUE_KEYS = {"single_select": "singleSelectOptionId", "iteration": "iterationId"}
 
-# ── Project field mutations ──────────────────────────────────────────────
 
 def set_project_field(project_id, item_id, field_id, value, field_type):
-    if field_type == "single_select":
-        val_str = f'singleSelectOptionId: "{value}"'
-    elif field_type == "iteration":
-        val_str = f'iterationId: "{value}"'
-    else:
-        return
-    gh_graphql(f"""
-    mutation {{
-      updateProjectV2ItemFieldValue(input: {{
-        projectId: "{project_id}"
-        itemId: "{item_id}"
-        fieldId: "{field_id}"
-        value: {{ {val_str} }}
-      }}) {{ projectV2Item {{ id }} }}
-    }}
-    """)
+    set_project_fields(project_id, item_id, [(field_id, value, field_type)])
+
+
+@functools.lru_cache(maxsize=8)
+def _set_fields_mutation(count):
+    """count aliased field updates, with $project, $item, $f0.. and $v0.."""
+    params = "".join(f", $f{i}: ID!, $v{i}: ProjectV2FieldValue!" for i in range(count))
+    updates = "".join(
+        f"  u{i}: updateProjectV2ItemFieldValue(input: {{\n"
+        f"    projectId: $project, itemId: $item, fieldId: $f{i}, value: $v{i}\n"
+        f"  }}) {{ projectV2Item {{ id }} }}\n"
+        for i in range(count)
+    )
+    return f"mutation($project: ID!, $item: ID!{params}) {{\n{updates}}}"
+
+
+def set_project_fields(project_id, item_id, fields):
+    """Set several fields on a project item in one GraphQL request.
+
+    fields is an iterable of (field_id, value, field_type); unsupported types
+    are skipped. Returns the response, or None if the request failed.
+    """
+    variables = {"project": project_id, "item": item_id}
+    count = 0
+    for field_id, value, field_type in fields:
+        value_key = _FIELD_VALUE_KEYS.get(field_type)
+        if value_key is None:
+            continue
+        variables[f"f{count}"] = field_id
+        variables[f"v{count}"] = {value_key: value}
+        count += 1
+    if not count:
+        return {}
+    return gh_graphql(_set_fields_mutation(count), variables)
 
 
 # ── Iteration queries ────────────────────────────────────────────────────
 
-def fetch_iterations(board_key):
-    board = BOARDS[board_key]
-    data = gh_graphql(f"""
-    {{
-      organization(login: "{ORG}") {{
-        projectV2(number: {board["number"]}) {{
-          field(name: "Iteration") {{
-            ... on ProjectV2IterationField {{
-              configuration {{
-                iterations {{ id title startDate duration }}
-              }}
-            }}
-          }}
-        }}
-      }}
-    }}
-    """)
-    if not data:
-        return []
+_ITERATION_FIELD = """
+          field(name: "Iteration") {
+            ... on ProjectV2IterationField {
+              configuration {
+                iterations { id title startDate duration }
+              }
+            }
+          }
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _iterations_query(count):
+    """The bulk iterations query for count boards, with $org and $n0..$n{count-1}."""
+    params = "".join(f", $n{i}: Int!" for i in range(count))
+    selections = "".join(
+        f"b{i}: projectV2(number: $n{i}) {{{_ITERATION_FIELD}}}\n" for i in range(count)
+    )
+    return f"query($org: String!{params}) {{ organization(login: $org) {{\n{selections}}} }}"
+
+
+def fetch_iterations_bulk(board_keys):
+    """Fetch several boards' iterations in one GraphQL query.
+
+    Each board is an aliased projectV2 lookup, so N boards cost one round
+    trip. Returns {board_key: [iteration dicts]}, where a board that wasn't
+    found maps to [], or None if the query itself failed.
+    """
+    board_keys = tuple(board_keys)
+    variables = {"org": ORG}
+    variables.update((f"n{i}", BOARDS[k]["number"]) for i, k in enumerate(board_keys))
+    data = gh_graphql(_iterations_query(len(board_keys)), variables, cache=_lookup_cache)
+    if data is None:
+        return None
+    org = (data.get("data") or {}).get("organization") or {}
     today = datetime.date.today()
-    field = data["data"]["organization"]["projectV2"]["field"]
+    return {
+        k: _parse_iterations((org.get(f"b{i}") or {}).get("field"), today)
+        for i, k in enumerate(board_keys)
+    }
+
+
+def _parse_iterations(field, today):
     results = []
-    for it in field["configuration"]["iterations"]:
+    for it in ((field or {}).get("configuration") or {}).get("iterations") or ():
         start = datetime.date.fromisoformat(it["startDate"])
         end = start + datetime.timedelta(days=it["duration"])
         results.append({
@@ -91,8 +428,20 @@ def fetch_iterations(board_key):
     return results
 
 
-def fetch_current_iteration(board_key):
-    for it in fetch_iterations(board_key):
+def fetch_iterations(board_key):
+    """The board's iterations, or None if the query failed."""
+    by_board = fetch_iterations_bulk((board_key,))
+    return None if by_board is None else by_board[board_key]
+
+
+def fetch_current_iteration(board_key, iterations=None):
+    """(id, title) of the board's current iteration, or (None, None).
+
+    Pass iterations (e.g. from fetch_iterations_bulk) to skip the fetch.
+    """
+    if iterations is None:
+        iterations = fetch_iterations(board_key)
+    for it in iterations or ():
         if it["current"]:
             return it["id"], it["title"]
     return None, None
@@ -101,19 +450,36 @@ def fetch_current_iteration(board_key):
 # ── Label queries ────────────────────────────────────────────────────────
 
 def fetch_labels(repo):
+    """The repo's labels, sorted by name, or None if the fetch failed."""
     if "/" not in repo:
         repo = f"{ORG}/{repo}"
-    labels = gh("label", "list", "--repo", repo, "--json",
-                "name,description", "--limit", "100", json_output=True)
-    return sorted(labels or [], key=lambda x: x["name"])
+    path = f"repos/{repo}/labels?per_page=100"
+    labels = _read_through(_lookup_cache, ("rest", path), lambda: gh_api_conditional(path))
+    return None if labels is None else _sorted_labels(labels)
+
+
+def _sorted_labels(labels):
+    """Normalise REST or GraphQL label objects to sorted {name, description} dicts."""
+    return sorted(
+        ({"name": l["name"], "description": l.get("description") or ""} for l in labels),
+        key=lambda x: x["name"],
+    )
 
 
 # ── Body builder ─────────────────────────────────────────────────────────
 
 # ── Issue queries ─────────────────────────────────────────────────────────
 
+def label_names(issue):
+    """Label names of an issue dict from gh's JSON.
+
+    The dict may be shared with gh's read cache, so it is left untouched.
+    """
+    return tuple(l["name"] for l in issue.get("labels") or ())
+
+
 def fetch_issues(repo, *, state="open", limit=30, labels=None, search=None, assignee=None):
-    """List issues from a repo. Returns a list of dicts.
+    """List issues from a repo. Returns a list of dicts, or None if gh failed.
 
     Supports filtering by state, labels, assignee, and a free-text search term.
     """
@@ -134,25 +500,153 @@ def fetch_issues(repo, *, state="open", limit=30, labels=None, search=None, assi
     if search:
         cmd.extend(["--search", search])
 
-    return gh(*cmd, json_output=True) or []
+    return gh(*cmd, json_output=True)
+
+
+@dataclass(slots=True)
+class Comment:
+    author: str
+    body: str
+    created: str  # YYYY-MM-DD
+
+
+@dataclass(slots=True)
+class Issue:
+    """A single issue's details, normalised once from gh's JSON."""
+    number: int
+    title: str
+    state: str  # OPEN / CLOSED
+    url: str = ""
+    body: str = ""
+    labels: tuple = ()     # label names
+    assignees: tuple = ()  # logins
+    milestone: str | None = None
+    comments: tuple = ()   # Comment, oldest first
+    repo_labels: list | None = None  # the repo's labels, when fetched alongside
+
+    @classmethod
+    def from_json(cls, data):
+        """Build from `gh issue view --json` output or the equivalent GraphQL node."""
+        ms = data.get("milestone")
+        comments = []
+        for cm in data.get("comments") or ():
+            author = cm.get("author")
+            comments.append(Comment(
+                author=author.get("login", "unknown") if isinstance(author, dict) else "unknown",
+                body=cm.get("body") or "",
+                created=(cm.get("createdAt") or "")[:10],
+            ))
+        return cls(
+            number=data["number"],
+            title=data["title"],
+            state=(data.get("state") or "UNKNOWN").upper(),
+            url=data.get("url") or "",
+            body=data.get("body") or "",
+            labels=label_names(data),
+            assignees=tuple(a["login"] for a in data.get("assignees") or ()),
+            milestone=(ms.get("title") if isinstance(ms, dict) else ms) or None,
+            comments=tuple(comments),
+        )
 
 
 def fetch_issue_detail(repo, number):
-    """Fetch full details for a single issue."""
+    """Fetch full details for a single issue. Returns an Issue, or None.
+
+    With an API token this is a one-issue fetch_issue_details_batch over the
+    kept-alive connection (so repo_labels comes along); otherwise `gh issue
+    view`.
+    """
     if "/" not in repo:
         repo = f"{ORG}/{repo}"
-    return gh(
+    if _auth_token():
+        return fetch_issue_details_batch(repo, [number]).get(int(number))
+    data = gh(
         "issue", "view", str(number), "--repo", repo,
         "--json", "number,title,body,state,labels,assignees,url,comments,milestone",
         json_output=True,
     )
+    return Issue.from_json(data) if data else None
+
+
+_DETAIL_BATCH_SIZE = 50  # aliased issue lookups per GraphQL query
+
+_DETAIL_FIELDS = """
+      number title body state url
+      labels(first: 100) { nodes { name description } }
+      assignees(first: 50) { nodes { login } }
+      comments(last: 100) { nodes { author { login } body createdAt } }
+      milestone { title }
+"""
+
+
+def fetch_issue_details_batch(repo, numbers):
+    """Fetch full details for several issues with aliased GraphQL lookups.
+
+    Returns {number: Issue} like fetch_issue_detail, with each Issue's
+    repo_labels set to the repo's label list (as fetch_labels returns it),
+    fetched in the same query. Issues missing from the result (not found, or
+    a failed query) are simply left out, so callers can fall back to
+    fetch_issue_detail for them.
+    """
+    if "/" not in repo:
+        repo = f"{ORG}/{repo}"
+    owner, name = repo.split("/", 1)
+    numbers = list(numbers)
+    details = {}
+    repo_labels = None
+    for start in range(0, len(numbers), _DETAIL_BATCH_SIZE):
+        chunk = numbers[start:start + _DETAIL_BATCH_SIZE]
+        selections = "".join(
+            f"i{n}: issue(number: {int(n)}) {{{_DETAIL_FIELDS}}}\n" for n in chunk
+        )
+        if start == 0:
+            selections += "repoLabels: labels(first: 100) { nodes { name description } }\n"
+        data = gh_graphql(
+            f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{\n{selections}}} }}",
+            {"owner": owner, "name": name},
+        )
+        # data may be the read cache's own copy, so it is only read, never modified
+        found = ((data or {}).get("data") or {}).get("repository") or {}
+        if "repoLabels" in found:
+            repo_labels = _sorted_labels(found["repoLabels"]["nodes"])
+        for alias, node in found.items():
+            if alias == "repoLabels" or not node:
+                continue
+            node = {
+                **node,
+                **{key: node[key]["nodes"] for key in ("labels", "assignees", "comments")},
+            }
+            issue = Issue.from_json(node)
+            issue.repo_labels = repo_labels
+            details[issue.number] = issue
+    return details
 
 
 def update_issue(repo, number, *, title=None, body=None,
                  add_labels=None, remove_labels=None, state=None, add_assignees=None):
-    """Edit an existing issue via `gh issue edit`."""
+    """Edit an existing issue. state is "open" or "closed".
+
+    Title, body and state changes are sent as one REST PATCH when the API
+    connection is available. Label or assignee changes (or no API token)
+    go through `gh issue edit`, followed by `gh issue close`/`reopen` when
+    state is given.
+    """
     if "/" not in repo:
         repo = f"{ORG}/{repo}"
+    if not (add_labels or remove_labels or add_assignees):
+        fields = {k: v for k, v in (("title", title), ("body", body), ("state", state)) if v}
+        resp = _api_request(
+            "PATCH", f"/repos/{repo}/issues/{int(number)}",
+            jsonio.dumps(fields).encode(), {"Content-Type": "application/json"},
+        )
+        if resp is not None:
+            invalidate_reads()
+            status, _, raw = resp
+            if status != 200:
+                print(f"  {RED}❌ gh error: HTTP {status} {raw[:200].decode(errors='replace')}{RESET}", file=sys.stderr)
+                return None
+            return jsonio.loads(raw).get("html_url") or ""
+
     cmd = ["issue", "edit", str(number), "--repo", repo]
     if title:
         cmd.extend(["--title", title])
@@ -162,27 +656,58 @@ def update_issue(repo, number, *, title=None, body=None,
         cmd.extend(["--add-label", ",".join(add_labels)])
     if remove_labels:
         cmd.extend(["--remove-label", ",".join(remove_labels)])
-    if state:
-        # gh uses --state for issue edit (open/closed)
-        # Actually gh issue edit doesn't have --state; use gh issue close/reopen
-        pass
     if add_assignees:
         cmd.extend(["--add-assignee", ",".join(add_assignees)])
-    return gh(*cmd)
+    result = ""
+    if len(cmd) > 5:
+        result = gh(*cmd)
+        if result is None:
+            return None
+    if state:
+        # gh issue edit has no --state; closing and reopening are their own commands
+        verb = "close" if state == "closed" else "reopen"
+        result = gh("issue", verb, str(number), "--repo", repo)
+    return result
 
 
-def close_issue(repo, number):
-    """Close an issue."""
+def create_issue(repo, title, body, labels=()):
+    """Open an issue. Returns {"url", "node_id"}, or None on failure.
+
+    Sent as one REST POST when the API connection is available, which also
+    gives the node id needed to add the issue to a project. Otherwise it
+    goes through `gh issue create`, and node_id is None.
+    """
     if "/" not in repo:
         repo = f"{ORG}/{repo}"
-    return gh("issue", "close", str(number), "--repo", repo)
+    resp = _api_request(
+        "POST", f"/repos/{repo}/issues",
+        jsonio.dumps({"title": title, "body": body, "labels": list(labels)}).encode(),
+        {"Content-Type": "application/json"},
+    )
+    if resp is not None:
+        invalidate_reads()
+        status, _, raw = resp
+        if status != 201:
+            print(f"  {RED}❌ gh error: HTTP {status} {raw[:200].decode(errors='replace')}{RESET}", file=sys.stderr)
+            return None
+        data = jsonio.loads(raw)
+        return {"url": data["html_url"], "node_id": data["node_id"]}
+
+    cmd = ["issue", "create", "--repo", repo, "--title", title, "--body", body]
+    for lbl in labels:
+        cmd.extend(["--label", lbl])
+    url = gh(*cmd)
+    return {"url": url, "node_id": None} if url else None
+
+
+def close_issue(repo, number):
+    """Close an issue."""
+    return update_issue(repo, number, state="closed")
 
 
 def reopen_issue(repo, number):
     """Reopen a closed issue."""
-    if "/" not in repo:
-        repo = f"{ORG}/{repo}"
-    return gh("issue", "reopen", str(number), "--repo", repo)
+    return update_issue(repo, number, state="open")
 
 
 def add_issue_comment(repo, number, comment_body):
@@ -0,0 +1,34 @@
+"""
+jsonio — JSON encode/decode helpers.
+
+Uses orjson when it is installed (pip install orjson) and falls back to the
+standard library otherwise. Both raise json.JSONDecodeError on bad input.
+"""
+
+import json
+
+from json import JSONDecodeError  # noqa: F401 — re-exported for callers
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+
+if _orjson is not None:
+    def loads(data):
+        """Parse a JSON str or bytes."""
+        return _orjson.loads(data)
+
+    def dumps(obj, *, indent=False):
+        """Serialise obj to a JSON str, optionally indented by two spaces."""
+        option = _orjson.OPT_INDENT_2 if indent else 0
+        return _orjson.dumps(obj, option=option).decode()
+else:
+    def loads(data):
+        """Parse a JSON str or bytes."""
+        return json.loads(data)
+
+    def dumps(obj, *, indent=False):
+        """Serialise obj to a JSON str, optionally indented by two spaces."""
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
@@ -11,14 +11,20 @@ The file uses the VS Code Markdown Kanban extension format:
 """
 
 import datetime
+import functools
+import heapq
+import io
+import operator
 import os
 import re
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from .config import WORKSPACE
 from .ui import (
     BOLD, CYAN, DIM, GREEN, YELLOW, RED, MAGENTA, RESET,
-    BACK, QUIT,
+    BANNER, CLEAR, BACK, QUIT,
     clear, banner, prompt, pick_one, yn, multiline,
 )
 
@@ -29,44 +35,75 @@ KANBAN_PATH = os.path.join(WORKSPACE, "board.kanban.md")
 # ═════════════════════════════════════════════════════════════════════════════
 
 class Card:
-    __slots__ = ("title", "meta", "body")
+    __slots__ = ("body", "due", "meta", "title")
 
     def __init__(self, title, meta=None, body=None):
         self.title = title
         self.meta = meta or {}
         self.body = body or ""
+        self.due = _parse_due(self.meta.get("due"))  # date or None; refresh after editing meta
 
     def __repr__(self):
         return f"Card({self.title!r})"
 
+    def copy(self):
+        return Card(self.title, dict(self.meta), self.body)
+
 
 class Board:
     def __init__(self, columns=None):
         self.columns = columns or []  # [(name, [Card, ...]), ...]
+        # Lower-cased name -> that column's card list (the same list object,
+        # so card moves need no resync). The first column wins on duplicates.
+        self._index = {}
+        for name, cards in self.columns:
+            self._index.setdefault(name.lower(), cards)
+        self._names = tuple(name for name, _ in self.columns)
 
     def column_names(self):
-        return [name for name, _ in self.columns]
+        return self._names
 
     def get_column(self, name):
-        for col_name, cards in self.columns:
-            if col_name.lower() == name.lower():
-                return cards
-        return None
+        return self._index.get(name.lower())
 
     def column_counts(self):
         return [(name, len(cards)) for name, cards in self.columns]
 
+    def copy(self):
+        """A copy whose columns and cards can be mutated independently."""
+        return Board([(name, [c.copy() for c in cards]) for name, cards in self.columns])
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 # PARSER
 # ═════════════════════════════════════════════════════════════════════════════
 
+# Each pattern is only tried on lines that pass a cheap prefix test, so the
+# body and blank lines that make up most of the file skip the regex engine.
+_H2_RE = re.compile(r"## (.+)")
+_H3_RE = re.compile(r"### (.+)")
+_META_RE = re.compile(r"-\s+(\w[\w\s]*?):\s*(.+)")
+
+# The last board parsed or written, keyed by the file's (path, mtime, size).
+# Callers mutate the boards they get, so only copies go in or out.
+_board_cache = {}  # "entry" -> (key, Board), replaced as a unit for threaded callers
+
+
+def _stat_key(path):
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
 def parse_board(path=None):
-    """Parse board.kanban.md → Board object."""
-    path = path or KANBAN_PATH
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
+    """Parse board.kanban.md → Board object.
 
+    An unchanged file is served from _board_cache instead of re-parsed.
+    """
+    path = path or KANBAN_PATH
+    key = _stat_key(path)
+    entry = _board_cache.get("entry")
+    if entry is not None and entry[0] == key:
+        return entry[1].copy()
     columns = []
     current_col = None
     current_cards = []
@@ -89,24 +126,29 @@ def parse_board(path=None):
             current_cards = []
             current_col = None
 
-    for line in text.split("\n"):
-        h2 = re.match(r"^## (.+)$", line)
-        if h2:
-            _flush_column()
-            current_col = h2.group(1).strip()
-            continue
-
-        h3 = re.match(r"^### (.+)$", line)
-        if h3:
-            _flush_card()
-            current_card = h3.group(1).strip()
-            continue
-
-        if current_card is not None:
-            card_lines.append(line)
+    # Read line by line rather than holding the whole file and its split copy
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            line = raw.rstrip("\n")
+            h2 = line.startswith("## ") and _H2_RE.match(line)
+            if h2:
+                _flush_column()
+                current_col = h2.group(1).strip()
+                continue
+
+            h3 = line.startswith("### ") and _H3_RE.match(line)
+            if h3:
+                _flush_card()
+                current_card = h3.group(1).strip()
+                continue
+
+            if current_card is not None:
+                card_lines.append(line)
 
     _flush_column()
-    return Board(columns)
+    board = Board(columns)
+    _board_cache["entry"] = (key, board.copy())
+    return board
 
 
 def _parse_card_block(lines):
@@ -125,7 +167,7 @@ def _parse_card_block(lines):
         if in_fence:
             body_lines.append(stripped)
         else:
-            m = re.match(r"^-\s+(\w[\w\s]*?):\s*(.+)$", stripped)
+            m = stripped.startswith("-") and _META_RE.fullmatch(stripped)
             if m:
                 key = m.group(1).strip().lower()
                 val = m.group(2).strip()
@@ -158,8 +200,23 @@ def write_board(board, path=None):
                         lines.append(f"    {body_line}")
                     lines.append("    ```")
                 lines.append("")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+    # Write a sibling temp file and rename it over the board, so a crash
+    # can't leave a half-written file and editors watching it see one change
+    target = os.path.realpath(path)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        if os.path.exists(target):
+            shutil.copymode(target, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    _board_cache["entry"] = (_stat_key(path), board.copy())
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -182,8 +239,7 @@ def _pick_card(board, exclude_columns=("Done",)):
 
     print(f"\n  {BOLD}Pick a card:{RESET}\n")
     for i, (col_name, _, card) in enumerate(options, 1):
-        due = _parse_due(card)
-        due_str = f"  {DIM}{due:%d/%m}{RESET}" if due else ""
+        due_str = f"  {DIM}{card.due:%d/%m}{RESET}" if card.due else ""
         print(f"    {CYAN}{i:>2}{RESET}  {card.title}{due_str}  {DIM}[{col_name}]{RESET}")
     print()
 
@@ -289,6 +345,7 @@ def edit_card(board):
             del card.meta["due"]
         elif new_due.lower() != "none":
             card.meta["due"] = new_due
+        card.due = _parse_due(card.meta.get("due"))
 
     if card.body:
         print(f"\n  {DIM}Current body:{RESET}")
@@ -353,11 +410,18 @@ def delete_card(board):
 # DASHBOARD
 # ═════════════════════════════════════════════════════════════════════════════
 
+_board_loader = ThreadPoolExecutor(max_workers=1)
+
+
 def kanban_menu():
     """Kanban dashboard with card management."""
     view = "dashboard"  # or "board"
     while True:
-        board = parse_board()
+        # Clear and draw the banner while the board loads; the views draw below it
+        future = _board_loader.submit(parse_board)
+        sys.stdout.write(f"{CLEAR}{BANNER}")
+        sys.stdout.flush()
+        board = future.result()
         if view == "dashboard":
             _show_dashboard(board)
         else:
@@ -383,15 +447,25 @@ def kanban_menu():
             delete_card(board)
 
 
+_TAG_IN_PROGRESS = f"{MAGENTA}in progress{RESET}"
+_TAG_TODAY = f"{YELLOW}due today{RESET}"
+_TAG_TOMORROW = f"{YELLOW}due tomorrow{RESET}"
+_DUE_TODAY = f"  {YELLOW}today{RESET}"
+_BODY_HINT = f"  {DIM}📝{RESET}"
+_BY_SORT_DATE = operator.itemgetter(3)
+
+
 def _show_dashboard(board):
     """Render the kanban dashboard: this week's focus, top todos, and action bar."""
     today = datetime.date.today()
     week_start = today - datetime.timedelta(days=today.weekday())
     week_end = week_start + datetime.timedelta(days=6)
 
-    clear()
-    banner()
-    print(f"  {BOLD}📋 Kanban Dashboard{RESET}  {DIM}week of {week_start:%d/%m} – {week_end:%d/%m/%Y}{RESET}\n")
+    # The dashboard is built in a buffer and written in one call
+    buf = io.StringIO()
+    out = functools.partial(print, file=buf)
+
+    out(f"  {BOLD}📋 Kanban Dashboard{RESET}  {DIM}week of {week_start:%d/%m} – {week_end:%d/%m/%Y}{RESET}\n")
 
     # ── Section 1: This Week ─────────────────────────────────────────────
     focus_items = []  # (card, column_name, tag, sort_date)
@@ -403,10 +477,10 @@ def _show_dashboard(board):
         is_wip = col_name.lower() in ("in progress",)
 
         for card in cards:
-            due = _parse_due(card)
+            due = card.due
 
             if is_wip:
-                tag = f"{MAGENTA}in progress{RESET}"
+                tag = _TAG_IN_PROGRESS
                 if due and due < today:
                     tag = f"{RED}in progress · {(today - due).days}d overdue{RESET}"
                 focus_items.append((card, col_name, tag, due or datetime.date.max))
@@ -417,23 +491,23 @@ def _show_dashboard(board):
                 elif due <= week_end:
                     delta = (due - today).days
                     if delta == 0:
-                        tag = f"{YELLOW}due today{RESET}"
+                        tag = _TAG_TODAY
                     elif delta == 1:
-                        tag = f"{YELLOW}due tomorrow{RESET}"
+                        tag = _TAG_TOMORROW
                     else:
                         tag = f"{GREEN}due {due:%a %d/%m}{RESET}"
                     focus_items.append((card, col_name, tag, due))
 
-    focus_items.sort(key=lambda x: x[3])
+    focus_items.sort(key=_BY_SORT_DATE)
 
-    print(f"  {BOLD}{YELLOW}🔥 This Week{RESET}\n")
+    out(f"  {BOLD}{YELLOW}🔥 This Week{RESET}\n")
     if focus_items:
         for i, (card, col_name, tag, _) in enumerate(focus_items, 1):
             col_hint = f"  {DIM}[{col_name}]{RESET}" if col_name.lower() != "in progress" else ""
-            print(f"    {CYAN}{i:>2}{RESET}  {card.title}  {tag}{col_hint}")
+            out(f"    {CYAN}{i:>2}{RESET}  {card.title}  {tag}{col_hint}")
     else:
-        print(f"    {GREEN}Nothing urgent this week! 🎉{RESET}")
-    print()
+        out(f"    {GREEN}Nothing urgent this week! 🎉{RESET}")
+    out()
 
     # ── Section 2: Top Todos ─────────────────────────────────────────────
     todo_cards = board.get_column("To Do") or []
@@ -441,17 +515,16 @@ def _show_dashboard(board):
     dated = []
     undated = []
     for card in todo_cards:
-        due = _parse_due(card)
-        if due:
-            dated.append((card, due))
+        if card.due:
+            dated.append((card, card.due))
         else:
             undated.append(card)
 
-    dated.sort(key=lambda x: x[1])
-    top = [(c, d) for c, d in dated] + [(c, None) for c in undated]
-    top = top[:15]
+    # Only the first 15 are shown, so select them rather than sorting all
+    top = heapq.nsmallest(15, dated, key=lambda x: x[1])
+    top += [(c, None) for c in undated[:15 - len(top)]]
 
-    print(f"  {BOLD}{CYAN}📋 Top Todos{RESET}  {DIM}({len(todo_cards)} total in backlog){RESET}\n")
+    out(f"  {BOLD}{CYAN}📋 Top Todos{RESET}  {DIM}({len(todo_cards)} total in backlog){RESET}\n")
     if top:
         for i, (card, due) in enumerate(top, 1):
             due_str = ""
@@ -460,24 +533,25 @@ def _show_dashboard(board):
                 if delta < 0:
                     due_str = f"  {RED}⚠ {abs(delta)}d overdue{RESET}"
                 elif delta == 0:
-                    due_str = f"  {YELLOW}today{RESET}"
+                    due_str = _DUE_TODAY
                 elif delta <= 7:
                     due_str = f"  {YELLOW}{due:%a %d/%m}{RESET}"
                 else:
                     due_str = f"  {DIM}{due:%d/%m}{RESET}"
-            body_hint = f"  {DIM}📝{RESET}" if card.body else ""
-            print(f"    {CYAN}{i:>2}{RESET}  {card.title}{due_str}{body_hint}")
+            body_hint = _BODY_HINT if card.body else ""
+            out(f"    {CYAN}{i:>2}{RESET}  {card.title}{due_str}{body_hint}")
     else:
-        print(f"    {DIM}(backlog is empty){RESET}")
-    print()
+        out(f"    {DIM}(backlog is empty){RESET}")
+    out()
 
     # ── Board summary bar ────────────────────────────────────────────────
     counts = board.column_counts()
     summary = "  ·  ".join(f"{name}: {n}" for name, n in counts)
-    print(f"  {DIM}{summary}{RESET}\n")
+    out(f"  {DIM}{summary}{RESET}\n")
 
     # ── Action bar ────────────────────────────────────────────────────────
-    print(f"  {BOLD}Actions:{RESET}  {CYAN}v{RESET}iew board · {CYAN}a{RESET}dd · {CYAN}m{RESET}ove · {CYAN}e{RESET}dit · {CYAN}d{RESET}one · {RED}x{RESET} delete · {DIM}↩ return{RESET}\n")
+    out(f"  {BOLD}Actions:{RESET}  {CYAN}v{RESET}iew board · {CYAN}a{RESET}dd · {CYAN}m{RESET}ove · {CYAN}e{RESET}dit · {CYAN}d{RESET}one · {RED}x{RESET} delete · {DIM}↩ return{RESET}\n")
+    sys.stdout.write(buf.getvalue())
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -503,20 +577,26 @@ def _show_board(board):
     if not visible:
         return
 
-    clear()
-    banner()
+    # The frame is built in a buffer and written in one call
+    buf = io.StringIO()
+    out = functools.partial(print, file=buf)
 
     n_cols = len(visible)
     gutter = 2                                    # space between columns
     left_margin = 2
     usable = term_width - left_margin - (gutter * (n_cols - 1))
     col_w = max(18, usable // n_cols)             # min 18 chars per column
+    margin = " " * left_margin
+    blank_cell = " " * col_w
 
     # ── Header row ────────────────────────────────────────────────────────
+    # Per-column colours and lengths, indexed by position in the row loop
+    colours = [_COL_COLOURS.get(n.lower(), CYAN) for n, _ in visible]
+    lens = [len(c) for _, c in visible]
+
     headers = []
     dividers = []
-    for col_name, cards in visible:
-        colour = _COL_COLOURS.get(col_name.lower(), CYAN)
+    for (col_name, cards), colour in zip(visible, colours):
         label = f"{col_name} ({len(cards)})"
         if len(label) > col_w:
             label = label[:col_w - 1] + "…"
@@ -524,43 +604,43 @@ def _show_board(board):
         dividers.append(f"{DIM}{'─' * col_w}{RESET}")
 
     sep = " " * gutter
-    print(f"{' ' * left_margin}{sep.join(headers)}")
-    print(f"{' ' * left_margin}{sep.join(dividers)}")
+    out(margin + sep.join(headers))
+    out(margin + sep.join(dividers))
 
     # ── Card rows ─────────────────────────────────────────────────────────
-    max_rows = max(len(cards) for _, cards in visible)
+    max_rows = max(lens)
     # Cap at a sensible height so the board doesn't scroll forever
     display_rows = min(max_rows, 30)
 
     for row in range(display_rows):
         cells = []
-        for col_name, cards in visible:
-            if row < len(cards):
-                card = cards[row]
-                colour = _COL_COLOURS.get(col_name.lower(), CYAN)
-                cell = _format_board_card(card, col_w, today, colour)
+        for i, (_, cards) in enumerate(visible):
+            if row < lens[i]:
+                cell = _format_board_card(cards[row], col_w, today, colours[i])
             else:
-                cell = " " * col_w
+                cell = blank_cell
             cells.append(cell)
-        print(f"{' ' * left_margin}{sep.join(cells)}")
+        out(margin + sep.join(cells))
 
     # ── Overflow indicator ────────────────────────────────────────────────
     overflow = []
-    for col_name, cards in visible:
-        extra = len(cards) - display_rows
+    for (col_name, _), n_cards in zip(visible, lens):
+        extra = n_cards - display_rows
         if extra > 0:
             overflow.append(f"{DIM}+{extra} more in {col_name}{RESET}")
     if overflow:
-        print(f"\n{' ' * left_margin}{('  ·  ').join(overflow)}")
-    print()
+        out(f"\n{margin}{('  ·  ').join(overflow)}")
+    out()
 
     # ── Action bar ────────────────────────────────────────────────────────
-    print(f"  {BOLD}Actions:{RESET}  {CYAN}v{RESET}iew dashboard · {CYAN}a{RESET}dd · {CYAN}m{RESET}ove · {CYAN}e{RESET}dit · {CYAN}d{RESET}one · {RED}x{RESET} delete · {DIM}↩ return{RESET}\n")
+    out(f"  {BOLD}Actions:{RESET}  {CYAN}v{RESET}iew dashboard · {CYAN}a{RESET}dd · {CYAN}m{RESET}ove · {CYAN}e{RESET}dit · {CYAN}d{RESET}one · {RED}x{RESET} delete · {DIM}↩ return{RESET}\n")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 def _format_board_card(card, width, today, colour):
     """Format a single card cell for the board view."""
-    due = _parse_due(card)
+    due = card.due
     indicator = ""
     if due:
         delta = (due - today).days
@@ -586,17 +666,20 @@ def _format_board_card(card, width, today, colour):
     visible_len = len(title) + reserved
     padding = max(0, width - visible_len)
 
-    return f"{colour}{title}{RESET}{indicator}{body_hint}{' ' * padding}"
+    return "".join((colour, title, RESET, indicator, body_hint, " " * padding))
 
 
 # ═════════════════════════════════════════════════════════════════════════════
 # HELPERS
 # ═════════════════════════════════════════════════════════════════════════════
 
-def _parse_due(card):
-    """Return a datetime.date for the card's due field, or None."""
-    raw = card.meta.get("due")
-    if not raw:
+def _parse_due(raw):
+    """Return a datetime.date for a card's due field, or None.
+
+    Cards built by the web API can carry any JSON value in meta, so anything
+    that isn't a string counts as no due date.
+    """
+    if not raw or not isinstance(raw, str):
         return None
     try:
         return datetime.date.fromisoformat(raw)
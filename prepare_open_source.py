@@ -10,10 +10,13 @@ Usage:
 
 from __future__ import annotations
 
+import mmap
 import os
 import re
 import shutil
+import stat
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 
@@ -39,139 +42,162 @@ def should_exclude(path: Path) -> bool:
     return False
 
 
-def sanitise_ai_py(content: str) -> str:
-    """Remove Sandvik-specific content from ai.py."""
-    
-    # Add _DEFAULT_BOARD constant after imports
-    content = re.sub(
-        r"(from \.wizard import \([^)]+\))",
-        r"\1\n\n# Get first board key as default fallback\n_DEFAULT_BOARD = next(iter(BOARDS.keys())) if BOARDS else \"main\"",
-        content,
-    )
-    
-    # Replace hardcoded 'devx' with _DEFAULT_BOARD
-    content = re.sub(r"'devx'", "_DEFAULT_BOARD", content)
-    content = re.sub(r'"devx"', "_DEFAULT_BOARD", content)
-    
-    # Replace the Sandvik system prompt intro
-    content = re.sub(
-        r'You are a helpful assistant embedded in the Sandvik Issue Manager CLI\.',
-        'You are a helpful assistant embedded in the Issue Manager CLI.',
-        content,
-    )
-    
-    # Remove PARA method mention and active project folders
-    content = re.sub(
-        r"The workspace is organised using the PARA method \(Projects, Areas, Resources, Archive\)\.\n\n"
-        r"Active project folders: [^\n]+\n[^\n]+\n[^\n]+\n",
-        "",
-        content,
-    )
-    content = re.sub(
-        r"The workspace uses the PARA method \(Projects, Areas, Resources, Archive\)\.\n\n"
-        r"Active projects: [^\n]+\n[^\n]+\n",
-        "",
-        content,
-    )
-    
-    # Replace hardcoded repo-to-board mapping with dynamic version
-    content = re.sub(
-        r"Repository-to-board mapping:\n  - \{ORG\}/github-maintenance → devx board\n  - \{ORG\}/devx-prod-atlas → prodatlas board",
-        "Repository-to-board mapping:\n{board_repo_text}",
-        content,
-    )
-    
-    # Remove the epic-specific instructions block
-    content = re.sub(
-        r'Epic \(devx board only\) — match the issue to the closest epic:.*?If the issue clearly belongs to one epic, set it\. If ambiguous, omit\.\n\n',
-        '',
-        content,
-        flags=re.DOTALL,
-    )
-    
-    # Remove the priority/size/budget instructions
-    content = re.sub(
-        r'Priority \(devx board only\) — infer from urgency cues:.*?Status — use what the user specifies, otherwise default to "new" \(devx\) or "todo" \(prodatlas\)\.',
-        'Field selection guidelines:\n- Use the available field options shown in the board schema above.\n- For priority fields: "p0" = critical, "p1" = important, "p2" = normal (default if not specified).\n- For size fields: "xs" = trivial, "s" = small, "m" = medium, "l" = large, "xl" = very large.\n- For status fields: use what the user specifies, otherwise default to the first option.\n- If a field has options, only use values from those options.',
-        content,
-        flags=re.DOTALL,
-    )
-    
-    # Make JSON schema board field generic
-    content = re.sub(
-        r'"board": "devx" or "prodatlas"',
-        '"board": "<board_key from the list above>"',
-        content,
-    )
-    content = re.sub(
-        r'"board": _DEFAULT_BOARD or "prodatlas"',
-        '"board": "<board_key from the list above>"',
-        content,
+def _multi_sub(rules: list[tuple[str, str | Callable[[re.Match], bytes]]]) -> Callable[[bytes | mmap.mmap], bytes]:
+    """Combine (pattern, replacement) rules into one function that applies them in a single pass.
+
+    Each pattern becomes a named alternative of one regex, so the content is
+    scanned once; where several could match, the leftmost match wins, then
+    the earliest rule. Rules are written as text and matched against UTF-8
+    bytes; replacements are literal strings or callables taking the match.
+    """
+    union = re.compile(
+        "|".join(f"(?P<r{i}>{pattern})" for i, (pattern, _) in enumerate(rules)).encode(),
+        re.DOTALL,
     )
-    
-    # Remove "Use British English" (keep it neutral)
-    content = re.sub(r'\nUse British English\.', '', content)
-    content = re.sub(r' Use British English\.', '', content)
-    
-    return content
+    encoded = [r if callable(r) else r.encode() for _, r in rules]
+    repls = [r if callable(r) else (lambda m, b=r: b) for r in encoded]
+    return lambda content: union.sub(lambda m: repls[int(m.lastgroup[1:])](m), content)
+
+
+_DEFAULT_BOARD_DEF = (
+    b"\n\n# Get first board key as default fallback\n"
+    b'_DEFAULT_BOARD = next(iter(BOARDS.keys())) if BOARDS else "main"'
+)
+
+_FIELD_GUIDELINES = (
+    "Field selection guidelines:\n"
+    "- Use the available field options shown in the board schema above.\n"
+    '- For priority fields: "p0" = critical, "p1" = important, "p2" = normal (default if not specified).\n'
+    '- For size fields: "xs" = trivial, "s" = small, "m" = medium, "l" = large, "xl" = very large.\n'
+    "- For status fields: use what the user specifies, otherwise default to the first option.\n"
+    "- If a field has options, only use values from those options."
+)
+
+def _literal(old: str, new: str) -> tuple[str, str]:
+    """A rule for a plain-text substitution."""
+    return re.escape(old), new
+
+
+# Rules per exported file. Each list is compiled into one union pattern, so
+# a file is scanned once however many rules it has; where two rules could
+# match at the same place, the earlier one wins.
+_SANITISE_RULES = {
+    "ai.py": [
+        # Add _DEFAULT_BOARD constant after imports
+        (r"from \.wizard import \([^)]+\)", lambda m: m.group() + _DEFAULT_BOARD_DEF),
+        # Remove PARA method mention and active project folders
+        # (either wording: a three-line folder list or a two-line project list)
+        ((r"The workspace (?:is organised using|uses) the PARA method \(Projects, Areas, Resources, Archive\)\.\n\n"
+          r"(?:Active project folders: [^\n]+\n[^\n]+\n|Active projects: [^\n]+\n)[^\n]+\n"), ""),
+        # Replace hardcoded repo-to-board mapping with dynamic version
+        (r"Repository-to-board mapping:\n  - \{ORG\}/github-maintenance → devx board\n  - \{ORG\}/devx-prod-atlas → prodatlas board",
+         "Repository-to-board mapping:\n{board_repo_text}"),
+        # Remove the epic-specific instructions block
+        (r"Epic \(devx board only\) — match the issue to the closest epic:.*?If the issue clearly belongs to one epic, set it\. If ambiguous, omit\.\n\n", ""),
+        # Replace the priority/size/budget instructions
+        (r'Priority \(devx board only\) — infer from urgency cues:.*?Status — use what the user specifies, otherwise default to "new" \(devx\) or "todo" \(prodatlas\)\.',
+         _FIELD_GUIDELINES),
+        # Make JSON schema board field generic (before the 'devx' rules, which
+        # would otherwise match inside it)
+        _literal('"board": "devx" or "prodatlas"', '"board": "<board_key from the list above>"'),
+        _literal('"board": _DEFAULT_BOARD or "prodatlas"', '"board": "<board_key from the list above>"'),
+        # Replace hardcoded 'devx' with _DEFAULT_BOARD
+        _literal("'devx'", "_DEFAULT_BOARD"),
+        _literal('"devx"', "_DEFAULT_BOARD"),
+        # Replace the Sandvik system prompt intro
+        _literal("You are a helpful assistant embedded in the Sandvik Issue Manager CLI.",
+                 "You are a helpful assistant embedded in the Issue Manager CLI."),
+        # Remove "Use British English" (keep it neutral)
+        _literal("\nUse British English.", ""),
+        _literal(" Use British English.", ""),
+    ],
+    "analyse.py": [
+        _literal("reviewing the backlog for the DevX & ProdAtlas teams at Sandvik.",
+                 "reviewing a development team's backlog."),
+    ],
+    "cli.py": [
+        # Make the CLI example generic
+        _literal('--board devx --title "Fix monitoring"', '--board main --title "Fix monitoring"'),
+    ],
+}
+_SANITISERS = {name: _multi_sub(rules) for name, rules in _SANITISE_RULES.items()}
+
 
+def sanitise_ai_py(content: bytes | mmap.mmap) -> bytes:
+    """Remove Sandvik-specific content from ai.py (bytes or any bytes-like buffer)."""
+    return _SANITISERS["ai.py"](content)
 
-def sanitise_analyse_py(content: str) -> str:
+
+def sanitise_analyse_py(content: bytes) -> bytes:
     """Remove Sandvik-specific content from analyse.py."""
-    content = re.sub(
-        r'reviewing the backlog for the DevX & ProdAtlas teams at Sandvik\.',
-        "reviewing a development team's backlog.",
-        content,
-    )
-    return content
+    return _SANITISERS["analyse.py"](content)
 
 
-def sanitise_cli_py(content: str) -> str:
+def sanitise_cli_py(content: bytes) -> bytes:
     """Make the CLI example generic."""
-    content = re.sub(
-        r'--board devx --title "Fix monitoring"',
-        '--board main --title "Fix monitoring"',
-        content,
-    )
-    return content
+    return _SANITISERS["cli.py"](content)
 
 
 def sanitise_file(src_file: Path, dst_file: Path) -> None:
-    """Copy file, sanitising content if needed."""
-    content = src_file.read_text()
-    
+    """Copy file, sanitising content if needed.
+
+    The file is handled as UTF-8 bytes throughout, so it is never decoded
+    and re-encoded. ai.py, by far the largest, is matched straight from a
+    read-only memory map instead of being read into memory first.
+    """
     if src_file.name == "ai.py":
-        content = sanitise_ai_py(content)
-    elif src_file.name == "analyse.py":
-        content = sanitise_analyse_py(content)
-    elif src_file.name == "cli.py":
-        content = sanitise_cli_py(content)
-    
-    dst_file.write_text(content)
+        with open(src_file, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = sanitise_ai_py(mm)
+            except ValueError:  # empty files can't be mapped
+                content = sanitise_ai_py(f.read())
+    else:
+        content = _SANITISERS[src_file.name](src_file.read_bytes())
+
+    with open(dst_file, "wb") as f:
+        f.write(content)
     # Preserve permissions
     shutil.copystat(src_file, dst_file)
 
 
-def copy_tree(src: Path, dst: Path) -> None:
-    for root, dirs, files in os.walk(src):
-        root_path = Path(root)
-
-        dirs[:] = [d for d in dirs if not should_exclude(root_path / d)]
+def _copy_file(src: str, dst: str, st: os.stat_result) -> None:
+    """Copy contents, then mode and times from st (copy2 without its extra stats)."""
+    shutil.copyfile(src, dst)
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
 
-        rel = root_path.relative_to(src)
-        out_dir = dst / rel
-        out_dir.mkdir(parents=True, exist_ok=True)
 
-        for fname in files:
-            src_file = root_path / fname
-            if should_exclude(src_file):
+def _walk(src: str, dst: str) -> None:
+    """Copy directory src into the existing directory dst, pruning EXCLUDE names before touching them."""
+    in_issue_dir = os.path.basename(src) == ".issue"
+    with os.scandir(src) as it:
+        for entry in it:
+            name = entry.name
+            if name in EXCLUDE:
                 continue
-            
-            dst_file = out_dir / fname
-            if fname in SANITISE_FILES:
-                sanitise_file(src_file, dst_file)
+            if name == "config.json" and in_issue_dir and should_exclude(Path(entry.path)):
+                continue
+
+            dst_file = os.path.join(dst, name)
+            if entry.is_dir(follow_symlinks=False):
+                # The parent exists already, so one mkdir (not makedirs) will do
+                try:
+                    os.mkdir(dst_file)
+                except FileExistsError:
+                    pass
+                _walk(entry.path, dst_file)
+            elif entry.is_dir():
+                continue  # symlinked directories aren't followed (as with os.walk)
+            elif name in SANITISE_FILES:
+                sanitise_file(Path(entry.path), Path(dst_file))
             else:
-                shutil.copy2(src_file, dst_file)
+                _copy_file(entry.path, dst_file, entry.stat())
+
+
+def copy_tree(src: Path, dst: Path) -> None:
+    dst.mkdir(parents=True, exist_ok=True)
+    _walk(os.fspath(src), os.fspath(dst))
 
 
 def main() -> int:
@@ -6,11 +6,13 @@ Dependencies (fastapi, uvicorn) are imported lazily so the rest of the CLI
 works fine without them.
 """
 
+import asyncio
 import os
 import threading
 import time
 import webbrowser
 
+from . import jsonio
 from .kanban import Board, Card, parse_board, write_board, KANBAN_PATH
 
 WEB_DIST = os.path.join(os.path.dirname(__file__), "web", "dist")
@@ -20,10 +22,17 @@ def create_app():
     """Build the FastAPI app.  Imported lazily so fastapi stays optional."""
     from fastapi import FastAPI, HTTPException
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import FileResponse, JSONResponse
+    from fastapi.responses import JSONResponse, Response
     from pydantic import BaseModel
 
-    app = FastAPI(title="Kanban Board")
+    # Board payloads are encoded with orjson when it is installed
+    try:
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse as DefaultResponse
+    except ImportError:
+        DefaultResponse = JSONResponse
+
+    app = FastAPI(title="Kanban Board", default_response_class=DefaultResponse)
 
     app.add_middleware(
         CORSMiddleware,
@@ -83,6 +92,15 @@ def create_app():
             ]
         }
 
+    # Write handlers read, modify and rewrite the whole file; the lock keeps
+    # concurrent ones (e.g. a burst of drag-and-drops) from losing each
+    # other's changes. parse_board reuses its last parse while the file is
+    # unchanged, so back-to-back writes don't re-parse the markdown. The
+    # handlers are async and run only the file I/O on a worker thread, so
+    # writers queued on the lock wait on the event loop, not in the pool
+    # that serves GETs.
+    board_lock = asyncio.Lock()
+
     def _col_or_404(board, name):
         col = board.get_column(name)
         if col is None:
@@ -91,81 +109,106 @@ def create_app():
 
     # ── Routes ────────────────────────────────────────────────────────────
 
+    # The serialised board, keyed by the file's (mtime, size): repeat GETs
+    # of an unchanged file are answered without parsing or encoding. Writes
+    # change the stat, so they invalidate it without further bookkeeping.
+    # Write handlers encode the board they just wrote once, and store those
+    # bytes here as well as returning them.
+    board_cache = {}  # "entry" -> ((mtime_ns, size), JSON bytes)
+
+    def _board_response(board, st):
+        body = jsonio.dumps(_board_to_json(board)).encode()
+        board_cache["entry"] = ((st.st_mtime_ns, st.st_size), body)
+        return Response(content=body, media_type="application/json")
+
     @app.get("/api/board")
     def get_board():
-        return _board_to_json(parse_board())
+        st = os.stat(KANBAN_PATH)
+        entry = board_cache.get("entry")
+        if entry is None or entry[0] != (st.st_mtime_ns, st.st_size):
+            return _board_response(parse_board(), st)
+        return Response(content=entry[1], media_type="application/json")
 
     @app.put("/api/board")
-    def put_board(data: BoardModel):
+    async def put_board(data: BoardModel):
         """Full-board update (reorder after drag-and-drop)."""
-        columns = []
-        for col in data.columns:
-            cards = [Card(c.title, dict(c.meta), c.body) for c in col.cards]
-            columns.append((col.name, cards))
-        write_board(Board(columns))
-        return {"ok": True}
+        async with board_lock:
+            columns = []
+            for col in data.columns:
+                cards = [Card(c.title, c.meta, c.body) for c in col.cards]
+                columns.append((col.name, cards))
+            await asyncio.to_thread(write_board, Board(columns))
+            return {"ok": True}
 
     @app.post("/api/cards")
-    def add_card(payload: AddPayload):
-        board = parse_board()
-        col = _col_or_404(board, payload.column)
-        col.append(Card(payload.title, dict(payload.meta), payload.body))
-        write_board(board)
-        return _board_to_json(board)
+    async def add_card(payload: AddPayload):
+        async with board_lock:
+            board = await asyncio.to_thread(parse_board)
+            col = _col_or_404(board, payload.column)
+            col.append(Card(payload.title, payload.meta, payload.body))
+            await asyncio.to_thread(write_board, board)
+            return _board_response(board, os.stat(KANBAN_PATH))
 
     @app.put("/api/cards/move")
-    def move_card(payload: MovePayload):
-        board = parse_board()
-        src = _col_or_404(board, payload.from_column)
-        dst = _col_or_404(board, payload.to_column)
-        if payload.from_index < 0 or payload.from_index >= len(src):
-            raise HTTPException(400, "from_index out of range")
-        card = src.pop(payload.from_index)
-        dst.insert(min(payload.to_index, len(dst)), card)
-        write_board(board)
-        return _board_to_json(board)
+    async def move_card(payload: MovePayload):
+        async with board_lock:
+            board = await asyncio.to_thread(parse_board)
+            src = _col_or_404(board, payload.from_column)
+            dst = _col_or_404(board, payload.to_column)
+            if payload.from_index < 0 or payload.from_index >= len(src):
+                raise HTTPException(400, "from_index out of range")
+            card = src.pop(payload.from_index)
+            dst.insert(min(payload.to_index, len(dst)), card)
+            await asyncio.to_thread(write_board, board)
+            return _board_response(board, os.stat(KANBAN_PATH))
 
     @app.put("/api/cards/{column}/{index}")
-    def edit_card(column: str, index: int, payload: EditPayload):
-        board = parse_board()
-        col = _col_or_404(board, column)
-        if index < 0 or index >= len(col):
-            raise HTTPException(400, "index out of range")
-        card = col[index]
-        card.title = payload.title
-        card.meta = dict(payload.meta)
-        card.body = payload.body
-        write_board(board)
-        return _board_to_json(board)
+    async def edit_card(column: str, index: int, payload: EditPayload):
+        async with board_lock:
+            board = await asyncio.to_thread(parse_board)
+            col = _col_or_404(board, column)
+            if index < 0 or index >= len(col):
+                raise HTTPException(400, "index out of range")
+            card = col[index]
+            card.title = payload.title
+            card.meta = payload.meta
+            card.body = payload.body
+            await asyncio.to_thread(write_board, board)
+            return _board_response(board, os.stat(KANBAN_PATH))
 
     @app.delete("/api/cards/{column}/{index}")
-    def delete_card(column: str, index: int):
-        board = parse_board()
-        col = _col_or_404(board, column)
-        if index < 0 or index >= len(col):
-            raise HTTPException(400, "index out of range")
-        col.pop(index)
-        write_board(board)
-        return _board_to_json(board)
+    async def delete_card(column: str, index: int):
+        async with board_lock:
+            board = await asyncio.to_thread(parse_board)
+            col = _col_or_404(board, column)
+            if index < 0 or index >= len(col):
+                raise HTTPException(400, "index out of range")
+            col.pop(index)
+            await asyncio.to_thread(write_board, board)
+            return _board_response(board, os.stat(KANBAN_PATH))
 
     # ── Serve built frontend ─────────────────────────────────────────────
 
     if os.path.isdir(WEB_DIST):
         from fastapi.staticfiles import StaticFiles
-        # Assets first, then SPA fallback
-        if os.path.isdir(os.path.join(WEB_DIST, "assets")):
-            app.mount(
-                "/assets",
-                StaticFiles(directory=os.path.join(WEB_DIST, "assets")),
-                name="assets",
-            )
-
-        @app.get("/{path:path}")
-        def spa_fallback(path: str = ""):
-            fp = os.path.join(WEB_DIST, path)
-            if os.path.isfile(fp):
-                return FileResponse(fp)
-            return FileResponse(os.path.join(WEB_DIST, "index.html"))
+        from starlette.exceptions import HTTPException as StarletteHTTPException
+
+        class SPAStaticFiles(StaticFiles):
+            """Static files, with index.html for paths that aren't files (client-side routes)."""
+
+            async def get_response(self, path, scope):
+                try:
+                    response = await super().get_response(path, scope)
+                except StarletteHTTPException as exc:
+                    if exc.status_code != 404:
+                        raise
+                    response = None
+                if response is None or response.status_code == 404:
+                    response = await super().get_response("index.html", scope)
+                return response
+
+        # Mounted last, so the /api routes above take precedence
+        app.mount("/", SPAStaticFiles(directory=WEB_DIST, html=True), name="spa")
 
     return app
 
@@ -4,7 +4,13 @@ ui — Terminal UI primitives for the Issue Manager CLI.
 Colours, prompts, pickers, multi-line input, and step runner.
 """
 
+import contextlib
+import functools
+import io
 import sys
+from collections.abc import Mapping
+
+from .config import INTERACTIVE
 
 # ── Colour constants ─────────────────────────────────────────────────────
 
@@ -17,6 +23,9 @@ RED     = "\033[31m"
 MAGENTA = "\033[35m"
 RESET   = "\033[0m"
 CLEAR   = "\033[2J\033[H"
+# Save the cursor position / return to it and erase everything below
+SAVE_CURSOR    = "\0337"
+RESTORE_BELOW  = "\0338\033[J"
 
 BACK = "__BACK__"
 QUIT = "__QUIT__"
@@ -24,24 +33,48 @@ QUIT = "__QUIT__"
 
 # ── Screen helpers ───────────────────────────────────────────────────────
 
+BANNER = f"""
+{BOLD}{CYAN}  ┌──────────────────────────────────────────────┐
+    │            📋  Issue Manager CLI              │
+    │         GitHub Projects + Kanban Board         │
+  └──────────────────────────────────────────────┘{RESET}
+
+"""
+
+
 def clear():
     print(CLEAR, end="")
 
 
 def banner():
-    print(f"""
-{BOLD}{CYAN}  ┌──────────────────────────────────────────────┐
-    │            📋  Issue Manager CLI              │
-    │         GitHub Projects + Kanban Board         │
-  └──────────────────────────────────────────────┘{RESET}
-""")
+    sys.stdout.write(BANNER)
 
 
-def nav_hint(extra=""):
+def _nav_hint_text(extra=""):
     parts = [f"{DIM}↩ enter = confirm", "b = back", f"q = quit{RESET}"]
     if extra:
         parts.insert(0, extra)
-    print(f"  {' · '.join(parts)}\n")
+    return f"  {' · '.join(parts)}\n\n"
+
+
+@contextlib.contextmanager
+def buffered_stdout():
+    """Collect what is printed inside the block and write it out in one call on exit.
+
+    input() writes its prompt to sys.stdout as well, so prompt after the
+    block, not inside it.
+    """
+    real = sys.stdout
+    buf = sys.stdout = io.StringIO()
+    try:
+        yield
+    finally:
+        sys.stdout = real
+        real.write(buf.getvalue())
+
+
+def nav_hint(extra=""):
+    sys.stdout.write(_nav_hint_text(extra))
 
 
 # ── Input primitives ─────────────────────────────────────────────────────
@@ -60,20 +93,26 @@ def prompt(text, default=None):
     return raw if raw else default
 
 
+@functools.lru_cache(maxsize=64)
+def _render_pick(title, keys, allow_skip):
+    """The full pick_one screen, rendered once per distinct picker (run_steps redraws reuse it)."""
+    lines = [f"  {BOLD}{title}{RESET}\n\n"]
+    lines.extend(f"    {CYAN}{i:>2}{RESET}  {k}\n" for i, k in enumerate(keys, 1))
+    if allow_skip:
+        lines.append(f"    {DIM} 0  (skip){RESET}\n")
+    lines.append("\n")
+    lines.append(_nav_hint_text())
+    return "".join(lines)
+
+
 def pick_one(title, options, allow_skip=True):
     """
     Display numbered options. Returns the chosen key, or:
       - None if skipped
       - BACK / QUIT for navigation
     """
-    keys = list(options.keys()) if isinstance(options, dict) else options
-    print(f"  {BOLD}{title}{RESET}\n")
-    for i, k in enumerate(keys, 1):
-        print(f"    {CYAN}{i:>2}{RESET}  {k}")
-    if allow_skip:
-        print(f"    {DIM} 0  (skip){RESET}")
-    print()
-    nav_hint()
+    keys = list(options.keys()) if isinstance(options, Mapping) else options
+    sys.stdout.write(_render_pick(title, tuple(keys), allow_skip))
 
     while True:
         raw = prompt("Choose")
@@ -96,6 +135,12 @@ def pick_one(title, options, allow_skip=True):
         print(f"    {DIM}Enter a number (1-{len(keys)}) or name prefix{RESET}")
 
 
+def pause(text="Press enter to continue"):
+    """Wait for enter after a status message; a no-op when not INTERACTIVE."""
+    if INTERACTIVE:
+        prompt(text)
+
+
 def multiline(title, hint="blank line to finish"):
     """Multi-line input. First line 'b' = back, 'q' = quit."""
     print(f"  {BOLD}{title}{RESET}  {DIM}({hint}){RESET}\n")
@@ -157,14 +202,18 @@ def run_steps(steps, state, *, show_progress=True, step_label="Step"):
     The runner redraws the screen and shows progress before every step.
     Returns True if all steps completed, False if user quit.
     """
+    total = len(steps)
+    # Every progress bar is a window of total chars onto this template
+    bar_template = "█" * total + "░" * total
     idx = 0
-    while 0 <= idx < len(steps):
-        clear()
-        banner()
-        if show_progress:
-            step_count = f"{DIM}{step_label} {idx + 1}/{len(steps)}{RESET}"
-            bar = "█" * (idx + 1) + "░" * (len(steps) - idx - 1)
-            print(f"  {step_count}  {CYAN}{bar}{RESET}\n")
+    while 0 <= idx < total:
+        with buffered_stdout():
+            clear()
+            banner()
+            if show_progress:
+                step_count = f"{DIM}{step_label} {idx + 1}/{total}{RESET}"
+                bar = bar_template[total - idx - 1:2 * total - idx - 1]
+                print(f"  {step_count}  {CYAN}{bar}{RESET}\n")
 
         name, func = steps[idx]
         result = func(state)
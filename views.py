@@ -2,27 +2,49 @@
 views — Read-only view screens (boards, labels, iterations).
 """
 
+import functools
+import io
+import sys
+
+from .cache import cached, open_cache
 from .config import ORG, DEFAULT_REPO, BOARDS
-from .ui import BOLD, CYAN, DIM, GREEN, RESET, QUIT, BACK, clear, banner, prompt
-from .gh import fetch_iterations, fetch_labels
+from .ui import BOLD, CYAN, DIM, GREEN, RESET, QUIT, BACK, BANNER, CLEAR, clear, banner, prompt
+from .gh import fetch_iterations_bulk, fetch_labels, on_invalidate
+
+
+# Labels and iterations change rarely; warm() starts fetching them in the
+# background when the main menu opens, so these screens usually open
+# without waiting on gh.
+_cache = open_cache("views", maxsize=32, ttl=300)
+on_invalidate(_cache.clear)
+
+fetch_iterations_bulk = cached(_cache)(fetch_iterations_bulk)
+fetch_labels = cached(_cache)(fetch_labels)
+
+
+def warm():
+    """Prefetch the default repo's labels and every board's iterations."""
+    fetch_labels.prefetch(DEFAULT_REPO)
+    fetch_iterations_bulk.prefetch(tuple(BOARDS))
 
 
 def view_boards():
-    clear()
-    banner()
-    print(f"  {BOLD}📋 Project Boards{RESET}\n")
+    buf = io.StringIO()
+    out = functools.partial(print, file=buf)
+    out(f"{CLEAR}{BANNER}  {BOLD}📋 Project Boards{RESET}\n")
     for key, board in BOARDS.items():
         url = f"https://github.com/orgs/{ORG}/projects/{board['number']}"
-        print(f"    {BOLD}{key}{RESET}  →  {board['name']}")
-        print(f"    {DIM}{url}{RESET}")
+        out(f"    {BOLD}{key}{RESET}  →  {board['name']}")
+        out(f"    {DIM}{url}{RESET}")
         fields = board["fields"]
-        print(f"    Fields: {', '.join(fields.keys())}")
+        out(f"    Fields: {', '.join(fields.keys())}")
         for fname, fdata in fields.items():
             if "options" in fdata:
                 opts = ", ".join(fdata["options"].keys())
                 display = fname.replace("_", " ").title()
-                print(f"      {DIM}{display}: {opts}{RESET}")
-        print()
+                out(f"      {DIM}{display}: {opts}{RESET}")
+        out()
+    sys.stdout.write(buf.getvalue())
     prompt("Press enter to return")
 
 
@@ -36,26 +58,28 @@ def view_labels():
 
     labels = fetch_labels(repo)
     if not labels:
-        print(f"\n    {DIM}No labels found.{RESET}")
+        sys.stdout.write(f"\n    {DIM}No labels found.{RESET}\n\n")
     else:
-        print()
-        max_name = max(len(l["name"]) for l in labels)
-        for l in labels:
-            desc = l.get("description", "") or ""
-            print(f"    {l['name']:{max_name + 2}s}{DIM}{desc}{RESET}")
-    print()
+        # One pass over the labels pulls out both columns; the width comes from the names alone
+        names = [l["name"] for l in labels]
+        descs = [l.get("description") or "" for l in labels]
+        width = max(map(len, names)) + 2
+        rows = "\n".join(f"    {n:{width}s}{DIM}{d}{RESET}" for n, d in zip(names, descs))
+        sys.stdout.write(f"\n{rows}\n\n")
     prompt("Press enter to return")
 
 
 def view_iterations():
-    clear()
-    banner()
-    print(f"  {BOLD}🔄 Iterations{RESET}\n")
+    # The header goes out first, so the screen isn't blank while gh runs
+    sys.stdout.write(f"{CLEAR}{BANNER}  {BOLD}🔄 Iterations{RESET}\n\n")
+    by_board = fetch_iterations_bulk(tuple(BOARDS)) or {}
+    buf = io.StringIO()
+    out = functools.partial(print, file=buf)
     for board_key, board in BOARDS.items():
-        print(f"  {BOLD}{board['name']}{RESET}  {DIM}({board_key}){RESET}\n")
-        iterations = fetch_iterations(board_key)
-        for it in iterations:
+        out(f"  {BOLD}{board['name']}{RESET}  {DIM}({board_key}){RESET}\n")
+        for it in by_board.get(board_key) or ():
             marker = f"  {GREEN}← CURRENT{RESET}" if it["current"] else ""
-            print(f"    {it['title']:20s}  {DIM}{it['start']} → {it['end']}{RESET}{marker}")
-        print()
+            out(f"    {it['title']:20s}  {DIM}{it['start']} → {it['end']}{RESET}{marker}")
+        out()
+    sys.stdout.write(buf.getvalue())
     prompt("Press enter to return")
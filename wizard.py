@@ -2,21 +2,36 @@
 wizard — Step-by-step issue creation wizard and execution logic.
 """
 
+import functools
+import io
+import shutil
 import sys
 
-from .config import ORG, BOARDS
+from .cache import cached, open_cache
+from .config import ORG, BOARDS, BOARD_KEYS, BOARD_SEARCH_INDEX
 from .ui import (
     BOLD, CYAN, DIM, GREEN, YELLOW, RED, RESET,
-    BACK, QUIT,
-    clear, banner, nav_hint, prompt, pick_one, multiline,
+    BACK, QUIT, BANNER, SAVE_CURSOR, RESTORE_BELOW,
+    buffered_stdout, clear, banner, nav_hint, prompt, pick_one, multiline,
     criteria_input, yn, run_steps,
 )
 from .gh import (
-    gh, set_project_field, fetch_iterations, fetch_current_iteration,
-    fetch_labels, build_body,
+    gh, add_to_project, create_issue, set_project_fields,
+    fetch_iterations, fetch_current_iteration, fetch_labels, build_body,
+    on_invalidate,
 )
 
 
+# The labels and iterations for the chosen repo are fetched in the
+# background as soon as step_repo picks it, so they are usually ready by the
+# time the user has typed the title and description.
+_cache = open_cache("wizard", maxsize=16, ttl=300)
+on_invalidate(_cache.clear)
+
+fetch_labels = cached(_cache)(fetch_labels)
+fetch_iterations = cached(_cache)(fetch_iterations)
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 # WIZARD: CREATE ISSUE
 # ═════════════════════════════════════════════════════════════════════════════
@@ -54,44 +69,55 @@ def wizard_create():
 
 # ── Create-wizard steps ─────────────────────────────────────────────────
 
+# step_repo's board list comes from the fixed config, so it is rendered once
+_REPO_MENU = f"  {BOLD}📦 Repository{RESET}\n\n" + "".join(
+    f"    {CYAN}{i}{RESET}  {BOLD}{board['repo'].split('/')[-1]}{RESET}  {DIM}→ {board['name']}{RESET}\n"
+    f"       {DIM}https://github.com/orgs/{ORG}/projects/{board['number']}{RESET}\n"
+    f"       Fields: {DIM}{', '.join(board['fields'])}{RESET}\n\n"
+    for i, board in enumerate(BOARDS.values(), 1)
+)
+
+
 def step_repo(state):
     """Pick a repository — this also determines the board automatically."""
-    print(f"  {BOLD}📦 Repository{RESET}\n")
-    for i, (key, board) in enumerate(BOARDS.items(), 1):
-        repo = board["repo"]
-        url = f"https://github.com/orgs/{ORG}/projects/{board['number']}"
-        fields = ", ".join(board["fields"].keys())
-        print(f"    {CYAN}{i}{RESET}  {BOLD}{repo.split('/')[-1]}{RESET}  {DIM}→ {board['name']}{RESET}")
-        print(f"       {DIM}{url}{RESET}")
-        print(f"       Fields: {DIM}{fields}{RESET}\n")
-    nav_hint()
+    with buffered_stdout():
+        sys.stdout.write(_REPO_MENU)
+        nav_hint()
 
     raw = prompt("Choose repo (1/2)")
     if raw in (BACK, QUIT):
         return raw
-    keys = list(BOARDS.keys())
+    keys = BOARD_KEYS
     try:
         idx = int(raw) - 1
         if 0 <= idx < len(keys):
-            chosen = keys[idx]
-            state["board_key"] = chosen
-            state["repo"] = BOARDS[chosen]["repo"]
+            _choose_board(state, keys[idx])
             return True
     except (ValueError, TypeError):
         if raw:
-            for k, b in BOARDS.items():
-                if raw.lower() in b["repo"].lower() or k.lower().startswith(raw.lower()):
-                    state["board_key"] = k
-                    state["repo"] = b["repo"]
+            q = raw.lower()
+            for k, repo_lower, key_lower in BOARD_SEARCH_INDEX:
+                if q in repo_lower or key_lower.startswith(q):
+                    _choose_board(state, k)
                     return True
     return False
 
 
+def _choose_board(state, board_key):
+    """Set the board and its repo, and start fetching what later steps show."""
+    state["board_key"] = board_key
+    state["repo"] = BOARDS[board_key]["repo"]
+    fetch_labels.prefetch(state["repo"])
+    if "iteration" in BOARDS[board_key]["fields"]:
+        fetch_iterations.prefetch(board_key)
+
+
 def step_title(state):
-    print(f"  {BOLD}✏️  Issue Title{RESET}\n")
-    if state["title"]:
-        print(f"    Current: {YELLOW}{state['title']}{RESET}\n")
-    nav_hint()
+    with buffered_stdout():
+        print(f"  {BOLD}✏️  Issue Title{RESET}\n")
+        if state["title"]:
+            print(f"    Current: {YELLOW}{state['title']}{RESET}\n")
+        nav_hint()
     raw = prompt("Title", default=state.get("title"))
     if raw in (BACK, QUIT):
         return raw
@@ -103,13 +129,14 @@ def step_title(state):
 
 
 def step_description(state):
-    print(f"  {BOLD}📝 Description{RESET}\n")
-    if state["description"]:
-        print(f"    {DIM}Current:{RESET}")
-        for ln in state["description"].split("\n"):
-            print(f"      {ln}")
-        print()
-    nav_hint("type 'b' on first line to go back")
+    with buffered_stdout():
+        print(f"  {BOLD}📝 Description{RESET}\n")
+        if state["description"]:
+            print(f"    {DIM}Current:{RESET}")
+            for ln in state["description"].split("\n"):
+                print(f"      {ln}")
+            print()
+        nav_hint("type 'b' on first line to go back")
     raw = multiline("Write the description")
     if raw in (BACK, QUIT):
         return raw
@@ -118,13 +145,14 @@ def step_description(state):
 
 
 def step_criteria(state):
-    print(f"  {BOLD}☑️  Acceptance Criteria{RESET}\n")
-    if state["criteria"]:
-        print(f"    {DIM}Current:{RESET}")
-        for c in state["criteria"]:
-            print(f"      ☐ {c}")
-        print()
-    nav_hint("type 'b' on first entry to go back")
+    with buffered_stdout():
+        print(f"  {BOLD}☑️  Acceptance Criteria{RESET}\n")
+        if state["criteria"]:
+            print(f"    {DIM}Current:{RESET}")
+            for c in state["criteria"]:
+                print(f"      ☐ {c}")
+            print()
+        nav_hint("type 'b' on first entry to go back")
     raw = criteria_input()
     if raw in (BACK, QUIT):
         return raw
@@ -133,8 +161,9 @@ def step_criteria(state):
 
 
 def step_context(state):
-    print(f"  {BOLD}💡 Additional Context{RESET}  {DIM}(optional){RESET}\n")
-    nav_hint()
+    with buffered_stdout():
+        print(f"  {BOLD}💡 Additional Context{RESET}  {DIM}(optional){RESET}\n")
+        nav_hint()
     add = yn("Add extra context?")
     if add in (BACK, QUIT):
         return add
@@ -151,13 +180,18 @@ def step_context(state):
 def step_labels(state):
     print(f"  {BOLD}🏷️  Labels{RESET}\n")
     labels = fetch_labels(state["repo"])
+    # Kept for execute_create's label check, tagged with the repo in case
+    # the user steps back and picks another one
+    if labels is not None:
+        state["repo_label_names"] = (state["repo"], {l["name"].lower() for l in labels})
     if labels:
-        max_name = max(len(l["name"]) for l in labels)
-        print(f"    {DIM}Available on {state['repo']}:{RESET}\n")
-        for l in labels:
-            desc = l.get("description", "") or ""
-            print(f"      {l['name']:{max_name + 2}s}{DIM}{desc}{RESET}")
-        print()
+        names = [l["name"] for l in labels]
+        width = max(map(len, names)) + 2
+        rows = "\n".join(
+            f"      {n:{width}s}{DIM}{l.get('description') or ''}{RESET}"
+            for n, l in zip(names, labels)
+        )
+        sys.stdout.write(f"    {DIM}Available on {state['repo']}:{RESET}\n\n{rows}\n\n")
     nav_hint()
     raw = prompt("Labels (comma-separated, or blank to skip)")
     if raw in (BACK, QUIT):
@@ -166,6 +200,29 @@ def step_labels(state):
     return True
 
 
+class _RowCounter:
+    """Stands in for sys.stdout and counts the screen rows written through it.
+
+    input() flushes stdout before reading and the user's enter ends that
+    line, so every flush counts as a row too: the total can only overshoot.
+    """
+
+    def __init__(self, stream, rows=0):
+        self._stream = stream
+        self.rows = rows
+
+    def write(self, text):
+        self.rows += text.count("\n")
+        return self._stream.write(text)
+
+    def flush(self):
+        self.rows += 1
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
 def step_board_fields(state):
     """
     Sub-wizard for board-specific fields.
@@ -175,17 +232,39 @@ def step_board_fields(state):
     board_key = state["board_key"]
     board = BOARDS[board_key]
 
-    sub_steps = _build_field_steps(board_key)
+    sub_steps = _FIELD_STEPS_BY_BOARD[board_key]
+    total = len(sub_steps)
+    bar_template = "█" * total + "░" * total
     sub_idx = 0
 
-    while 0 <= sub_idx < len(sub_steps):
-        clear()
-        banner()
-        fname = sub_steps[sub_idx][0]
-        bar = "█" * (sub_idx + 1) + "░" * (len(sub_steps) - sub_idx - 1)
-        print(f"  {DIM}Board Fields — {fname.upper()} ({sub_idx + 1}/{len(sub_steps)}){RESET}  {CYAN}{bar}{RESET}\n")
+    # run_steps has just drawn the banner and its progress line, so each
+    # field only repaints the screen below them. The saved position is a
+    # screen row, though: once a field's output scrolls the terminal it is
+    # stale, and the next field clears the screen instead.
+    top_rows = BANNER.count("\n") + 2
+    real_stdout = sys.stdout
+    real_stdout.write(SAVE_CURSOR)
+    counter = None
+    while 0 <= sub_idx < total:
+        fname, handler = sub_steps[sub_idx]
+        bar = bar_template[total - sub_idx - 1:2 * total - sub_idx - 1]
+        header = (
+            f"  {DIM}Board Fields — {fname.upper()} ({sub_idx + 1}/{total}){RESET}"
+            f"  {CYAN}{bar}{RESET}\n\n"
+        )
+        if counter is not None and top_rows + counter.rows >= shutil.get_terminal_size().lines:
+            clear()
+            banner()
+            top_rows = BANNER.count("\n")
+            real_stdout.write(SAVE_CURSOR + header)
+        else:
+            real_stdout.write(RESTORE_BELOW + header)
 
-        result = sub_steps[sub_idx][1](state, board)
+        counter = sys.stdout = _RowCounter(real_stdout, rows=header.count("\n"))
+        try:
+            result = handler(state, board, fname)
+        finally:
+            sys.stdout = real_stdout
 
         if result == QUIT:
             return QUIT
@@ -199,38 +278,10 @@ def step_board_fields(state):
     return True
 
 
-def _build_field_steps(board_key):
-    board = BOARDS[board_key]
-    steps = []
-    order = ["status", "priority", "size", "epic", "team", "budget_category", "iteration"]
-    for f in order:
-        if f in board["fields"]:
-            steps.append((f, _make_field_func(f)))
-    return steps
-
-
-def _make_field_func(field_key):
-    """Return a step function for the given field key."""
-    handlers = {
-        "status":          _field_select,
-        "priority":        _field_select,
-        "size":            _field_select,
-        "epic":            _field_select,
-        "team":            _field_select,
-        "budget_category": _field_select,
-        "iteration":       _field_iteration,
-    }
-    base = handlers.get(field_key, _field_select)
-    def step_func(state, board):
-        return base(state, board, field_key)
-    return step_func
-
-
 def _field_select(state, board, field_key):
     """Generic picker for a single-select board field."""
     fdata = board["fields"][field_key]
-    display = field_key.replace("_", " ").title()
-    result = pick_one(display, fdata["options"])
+    result = pick_one(_FIELD_DISPLAY[field_key], fdata["options"])
     if result in (BACK, QUIT):
         return result
     if result:
@@ -244,18 +295,21 @@ def _field_iteration(state, board, field_key):
     board_key = state["board_key"]
     print(f"  {BOLD}Iteration{RESET}\n")
 
-    iterations = fetch_iterations(board_key)
-    for it in iterations:
-        marker = f"  {GREEN}← current{RESET}" if it["current"] else ""
-        print(f"    {it['title']:20s}  {DIM}{it['start']} → {it['end']}{RESET}{marker}")
-    print()
+    iterations = fetch_iterations(board_key) or []
+    current = f"  {GREEN}← current{RESET}"
+    rows = "".join(
+        f"    {it['title']:20s}  {DIM}{it['start']} → {it['end']}{RESET}"
+        f"{current if it['current'] else ''}\n"
+        for it in iterations
+    )
+    sys.stdout.write(rows + "\n")
     nav_hint()
 
     result = yn("Assign to current iteration?")
     if result in (BACK, QUIT):
         return result
     if result:
-        iter_id, iter_title = fetch_current_iteration(board_key)
+        iter_id, iter_title = fetch_current_iteration(board_key, iterations)
         if iter_id:
             fdata = board["fields"]["iteration"]
             state["fields"]["iteration"] = (fdata["id"], iter_id, "iteration")
@@ -267,28 +321,46 @@ def _field_iteration(state, board, field_key):
     return True
 
 
+# Display names for every board field key, e.g. "budget_category" -> "Budget Category"
+_FIELD_DISPLAY = {
+    f: f.replace("_", " ").title()
+    for board in BOARDS.values() for f in board["fields"]
+}
+
+# Each board's field sub-steps, as (field_key, handler) in wizard order.
+# BOARDS is fixed at import, so these are built once.
+_FIELD_ORDER = ("status", "priority", "size", "epic", "team", "budget_category", "iteration")
+_FIELD_STEPS_BY_BOARD = {
+    key: tuple(
+        (f, _field_iteration if f == "iteration" else _field_select)
+        for f in _FIELD_ORDER if f in board["fields"]
+    )
+    for key, board in BOARDS.items()
+}
+
+
 def step_review(state):
     """Full preview before creating."""
     board = BOARDS[state["board_key"]]
     body = build_body(state["description"], state["criteria"], state["extra_context"])
 
-    print(f"  {BOLD}🔍 Review & Confirm{RESET}\n")
-    print(f"    {BOLD}Board:{RESET}   {board['name']}")
-    print(f"    {BOLD}Repo:{RESET}    {state['repo']}")
-    print(f"    {BOLD}Title:{RESET}   {YELLOW}{state['title']}{RESET}")
+    buf = io.StringIO()
+    out = functools.partial(print, file=buf)
+    out(f"  {BOLD}🔍 Review & Confirm{RESET}\n")
+    out(f"    {BOLD}Board:{RESET}   {board['name']}")
+    out(f"    {BOLD}Repo:{RESET}    {state['repo']}")
+    out(f"    {BOLD}Title:{RESET}   {YELLOW}{state['title']}{RESET}")
     if state["labels"]:
-        print(f"    {BOLD}Labels:{RESET}  {', '.join(state['labels'])}")
+        out(f"    {BOLD}Labels:{RESET}  {', '.join(state['labels'])}")
 
-    field_names = []
     for k in state["fields"]:
-        display = k.replace("_", " ").title()
-        field_names.append(display)
-        print(f"    {BOLD}{display:{10}}{RESET} ✓")
+        out(f"    {BOLD}{_FIELD_DISPLAY[k]:{10}}{RESET} ✓")
 
-    print(f"\n  {DIM}{'─' * 44}{RESET}")
-    for line in body.split("\n"):
-        print(f"  {DIM}│{RESET} {line}")
-    print(f"  {DIM}{'─' * 44}{RESET}\n")
+    rule = f"  {DIM}{'─' * 44}{RESET}"
+    out(f"\n{rule}")
+    buf.write("".join(f"  {DIM}│{RESET} {line}\n" for line in body.split("\n")))
+    out(f"{rule}\n")
+    sys.stdout.write(buf.getvalue())
 
     result = yn(f"{BOLD}Create this issue?{RESET}")
     if result == QUIT:
@@ -305,48 +377,58 @@ def step_review(state):
 # EXECUTION
 # ═════════════════════════════════════════════════════════════════════════════
 
-def execute_create(state):
-    """Create the issue, add to board, set fields."""
+def execute_create(state, log=print):
+    """Create the issue, add to board, set fields. Returns the issue URL, or None.
+
+    Progress lines go through log, so callers running several creates at
+    once can buffer each one's output.
+    """
     board = BOARDS[state["board_key"]]
     body = build_body(state["description"], state["criteria"], state["extra_context"])
 
     # Validate labels — filter out any that don't exist on the repo
     requested_labels = state.get("labels", [])
     if requested_labels:
-        repo_labels = fetch_labels(state["repo"])
-        valid_names = {l["name"].lower() for l in repo_labels} if repo_labels else set()
-        valid_labels = [l for l in requested_labels if l.lower() in valid_names]
-        skipped = [l for l in requested_labels if l.lower() not in valid_names]
+        known = state.get("repo_label_names")
+        if known and known[0] == state["repo"]:
+            valid_names = known[1]
+        else:
+            valid_names = {l["name"].lower() for l in fetch_labels(state["repo"]) or ()}
+        valid_labels, skipped = [], []
+        for l in requested_labels:
+            (valid_labels if l.lower() in valid_names else skipped).append(l)
         if skipped:
-            print(f"  {YELLOW}⚠ Skipping non-existent labels: {', '.join(skipped)}{RESET}")
+            log(f"  {YELLOW}⚠ Skipping non-existent labels: {', '.join(skipped)}{RESET}")
     else:
         valid_labels = []
 
-    print(f"\n  ⏳ Creating issue...")
-    cmd = ["issue", "create", "--repo", state["repo"],
-           "--title", state["title"], "--body", body]
-    for lbl in valid_labels:
-        cmd.extend(["--label", lbl])
-
-    issue_url = gh(*cmd)
-    if not issue_url:
-        return
-    print(f"  {GREEN}✅ {issue_url}{RESET}")
-
-    print(f"  ⏳ Adding to {board['name']}...")
-    item_json = gh(
-        "project", "item-add", str(board["number"]),
-        "--owner", ORG, "--url", issue_url, "--format", "json",
-        json_output=True,
-    )
-    if not item_json:
-        return
-    item_id = item_json["id"]
-    print(f"  {GREEN}✅ Added to board{RESET}")
-
-    for key, (field_id, value, field_type) in state["fields"].items():
-        set_project_field(board["project_id"], item_id, field_id, value, field_type)
-        display = key.replace("_", " ").title()
-        print(f"  {GREEN}✅ {display}{RESET}")
+    log("\n  ⏳ Creating issue...")
+    created = create_issue(state["repo"], state["title"], body, valid_labels)
+    if not created:
+        return None
+    issue_url = created["url"]
+    log(f"  {GREEN}✅ {issue_url}{RESET}")
 
-    print(f"\n  🎉 Done! {issue_url}\n")
+    log(f"  ⏳ Adding to {board['name']}...")
+    if created["node_id"]:
+        item_id = add_to_project(board["project_id"], created["node_id"])
+    else:
+        add_args = ("project", "item-add", str(board["number"]), "--owner", ORG, "--url", issue_url)
+        if state["fields"]:
+            item_json = gh(*add_args, "--format", "json", json_output=True)
+            item_id = item_json["id"] if item_json else None
+        else:
+            # The item id is only needed to set fields, so gh's JSON output is skipped
+            item_id = gh(*add_args)
+    if item_id is None:
+        return issue_url
+    log(f"  {GREEN}✅ Added to board{RESET}")
+
+    if state["fields"] and set_project_fields(
+        board["project_id"], item_id, state["fields"].values(),
+    ) is not None:
+        for key in state["fields"]:
+            log(f"  {GREEN}✅ {_FIELD_DISPLAY[key]}{RESET}")
+
+    log(f"\n  🎉 Done! {issue_url}\n")
+    return issue_url